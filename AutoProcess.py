@@ -26,6 +26,8 @@ plugin_type = "PROCESS"            # Gwyddion plugin type
 # -----------------------------
 import os
 import re
+import collections
+import contextlib
 import sys
 import time
 import gtk               # GTK for GUI
@@ -42,27 +44,30 @@ import gwy               # Gwyddion main Python module (data browser, processing
 # Logging Setup
 # -----------------------------
 log_dir = tempfile.gettempdir()
-log_file = os.path.join(log_dir, "SPM_autoprocess.log")
+LOG_FILE = os.path.join(log_dir, "SPM_autoprocess.log")
 
 logger = logging.getLogger('SPM_autoprocess')
 logger.setLevel(logging.DEBUG)
 formatter = logging.Formatter("%(asctime)s,%(msecs)03d: %(message)s",
                               datefmt='%Y-%m-%d %H:%M:%S')
 
-try:
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    file_handler = logging.FileHandler(log_file, mode='w')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    logger.debug("Logger initialized with file handler: %s", log_file)
-except Exception as e:
-    # Fallback to console if file handler cannot be created
-    logger.debug("Failed to initialize file handler for %s: %s", log_file, str(e))
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    logger.debug("Using console handler due to file handler failure")
+# Configure handlers only once: a module reload must not truncate the log
+# again or stack a second handler on the shared 'SPM_autoprocess' logger.
+if not logger.handlers:
+    try:
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        file_handler = logging.FileHandler(LOG_FILE, mode='w')
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+        logger.debug("Logger initialized with file handler: %s", LOG_FILE)
+    except Exception as e:
+        # Fallback to console if file handler cannot be created
+        logger.debug("Failed to initialize file handler for %s: %s", LOG_FILE, str(e))
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+        logger.debug("Using console handler due to file handler failure")
 
 
 class StderrToLogger(object):
@@ -90,13 +95,45 @@ sys.stderr = StderrToLogger(logger)
 DATA_KEY          = "/%d/data"
 BASE_MIN_KEY      = "/%d/base/min"
 BASE_MAX_KEY      = "/%d/base/max"
+RANGE_KEY         = "/%d/base/range"
 RANGE_TYPE_KEY    = "/%d/base/range-type"
 VISIBLE_KEY       = "/%d/data/visible"
 SELECTION_KEYS    = ["/%d/select/rectangle", "/%d/data/selection"]
+CONFLICT_SEL_KEYS = ["/%d/select/pointer", "/%d/select/line"]
 FILENAME_KEY      = "/filename"
 TITLE_KEY         = "/%d/data/title"
 ORIGINAL_MIN_KEY  = "/%d/base/original_min"
 ORIGINAL_MAX_KEY  = "/%d/base/original_max"
+LOG_KEY           = "/%d/log"
+PALETTE_KEY       = "/%d/base/palette"
+
+# Title of the divider row appended after each file's channels, and the
+# full channel_liststore row used for it (shared, never modified)
+SEPARATOR_TITLE   = "──────────────────"
+SEPARATOR_ROW     = (False, SEPARATOR_TITLE, False, None, -1, "", None, None)
+
+# Per-channel keys formatted once per data_id and reused by the poll timers
+# and the batch operations instead of '%'-formatting on every access.
+ChannelKeys = collections.namedtuple(
+    "ChannelKeys", "data title base_min base_max base_range range_type "
+                   "orig_min orig_max selections conflict_selections log palette")
+_channel_keys_cache = {}
+
+
+def _keys_for(data_id):
+    """Return the ChannelKeys for data_id (cached; data_ids are small ints)."""
+    keys = _channel_keys_cache.get(data_id)
+    if keys is None:
+        keys = ChannelKeys(DATA_KEY % data_id, TITLE_KEY % data_id,
+                           BASE_MIN_KEY % data_id, BASE_MAX_KEY % data_id,
+                           RANGE_KEY % data_id, RANGE_TYPE_KEY % data_id,
+                           ORIGINAL_MIN_KEY % data_id, ORIGINAL_MAX_KEY % data_id,
+                           tuple(template % data_id for template in SELECTION_KEYS),
+                           tuple(template % data_id for template in CONFLICT_SEL_KEYS),
+                           LOG_KEY % data_id, PALETTE_KEY % data_id)
+        _channel_keys_cache[data_id] = keys
+    return keys
+
 
 # -----------------------------
 # State Holder to Avoid Globals
@@ -110,6 +147,7 @@ class PluginState(object):
     def __init__(self):
         # Macro (parsed entries from a log file)
         self.macro = []
+        self.macro_source = None    # (path, mtime, size) of the log it came from
 
         # GTK data models
         self.liststore = gtk.ListStore(int, str, str)
@@ -131,15 +169,25 @@ class PluginState(object):
         self.select_all_check = None
         self.select_dropdown = None
         self.select_store = None
+        self.treeview_channels = None
+        self.treeview_macro = None
 
         # Runtime bookkeeping
-        self.selection_connections = []
-        self.timeout_id = None
-        self.data_browser_timeout_id = None
+        # (container, data_id) -> (selection, conn_id) of its "changed" handler
+        self.selection_connections = {}
+        self.timeout_id = None              # poll_gwyddion timer
+        self.poll_interval = None           # its current period, ms
+        self.poll_idle_ticks = 0            # consecutive ticks with no change
         self.current_container = None
         self.current_data_id = None
         self.last_containers = None
         self.current_data_view = None
+        self.last_selection_params = None   # (x, y, w, h) last shown in the crop entries
+        self.checked_rows = set()           # channel_liststore row indices ticked
+        self.channel_rows = []              # row indices of selectable channel rows
+        self.row_keys = []                  # per row: (id(container), data_id) or None
+        self.channel_rows_by_index = {}     # per-file channel index -> row indices
+        self.channel_names_by_index = {}    # per-file channel index -> titles (dropdown)
 
 
 # Keep a single open GUI instance (avoid duplicates)
@@ -148,78 +196,169 @@ _plugin_gui_instance = None
 # --------------------------------
 # Log Parsing Utilities
 # --------------------------------
-def parse_log_entry(entry):
-    """Parse a single 'proc::func(params)@timestamp' line into a dict.
+_BOOL_PARAMS = {'true': True, 'false': False}
+
+
+def _coerce_param(value):
+    """Convert a raw parameter substring to bool/int/float/str.
 
-    Returns:
-        dict or None
-        Example: {'function': 'func', 'parameters': {...}, 'param_string': '...',
-                  'timestamp': '...', 'order': int (added by file parser)}
+    Called lazily at replay time; parsing only keeps the raw substrings.
+    The first character decides which conversion is worth trying.
     """
     try:
-        match = re.match(r"proc::(\w+)\((.*?)\)@(.+?)(?:Z|$)", entry)
-        if not match:
-            logger.debug("Skipping non-proc log entry")
-            return None
-
-        function, params, tstamp = match.groups()
-        param_string = params.strip()
-        param_dict = {}
-
-        if param_string:
-            # Split on commas not inside quotes
-            parts = re.split(r",\s*(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)", param_string)
-            for param in parts:
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    try:
-                        if value.lower() == 'true':
-                            param_dict[key] = True
-                        elif value.lower() == 'false':
-                            param_dict[key] = False
-                        elif value.replace('.', '', 1).isdigit():
-                            param_dict[key] = (float(value) if '.' in value else int(value))
-                        else:
-                            param_dict[key] = value.strip('\"')
-                    except Exception:
-                        param_dict[key] = value
-
-        return {
-            "function": function,
-            "parameters": param_dict,
-            "param_string": param_string,
-            "timestamp": tstamp.strip()
-        }
+        first = value[:1]
+        if first and first in '-.0123456789':
+            try:
+                return int(value)
+            except ValueError:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+        elif first in ('t', 'T', 'f', 'F'):
+            flag = _BOOL_PARAMS.get(value.lower())
+            if flag is not None:
+                return flag
+        return value.strip('\"')
     except Exception:
+        return value
+
+
+# Compiled once. _PROC_RE is anchored per line so parse_log_file can scan a
+# whole log buffer with finditer() instead of matching line by line. The
+# parameters run up to the first ")@" and the timestamp up to the first 'Z'
+# (or end of line); both are spelled as character classes rather than lazy
+# quantifiers, so each line is matched in a single forward pass.
+_PROC_RE = re.compile(r"^[ \t]*proc::(\w+)\(((?:[^)\n]|\)(?!@))*)\)@(.[^Z\n]*)", re.MULTILINE)
+
+# key=value pairs; a value runs to the next comma outside double quotes
+# (an unterminated quote runs to the end). Keys and values come back unstripped.
+_PARAM_RE = re.compile(r'([^=,"]*)=((?:"[^"]*(?:"|$)|[^,"])*)')
+
+
+# One parsed 'proc::' log line; fixed fields, so a tuple rather than a dict
+LogEntry = collections.namedtuple("LogEntry", "function parameters param_string timestamp")
+
+
+def _entry_from_match(match):
+    """Build a LogEntry from a _PROC_RE match, or None if it has no timestamp.
+
+    _PROC_RE accepts a blank-only timestamp (e.g. a trailing '@ ' before
+    the line end); such lines are not proc entries.
+    """
+    function, params, tstamp = match.groups()
+    tstamp = tstamp.strip()
+    if not tstamp:
         return None
+    param_string = params.strip()
+    # One regex sweep over the parameter body; values stay raw (see _coerce_param)
+    param_dict = dict((key.strip(), value.strip())
+                      for key, value in _PARAM_RE.findall(param_string))
+
+    return LogEntry(function, param_dict, param_string, tstamp)
 
 
 def parse_log_file(file_path):
-    """Parse a log file and return a list of parsed entries (with 'order')."""
-    log_entries = []
+    """Yield the parsed entries of a log file, in file order.
+
+    The file is read once and scanned with a single finditer(); non-proc
+    lines are skipped inside the regex engine. The caller materializes the
+    entries once (e.g. macro[:] = ...).
+
+    Raises IOError (on the first iteration) if the file cannot be read, so
+    a failed read is not mistaken for a log without proc entries.
+    """
+    with open(file_path, "rb") as f:  # raw bytes; CRLF is handled by _PROC_RE
+        data = f.read()
+
+    count = 0
+    for match in _PROC_RE.finditer(data):
+        try:
+            parsed = _entry_from_match(match)
+        except Exception:
+            continue
+        if parsed is None:
+            continue
+        count += 1
+        yield parsed
+    logger.info("Parsed %d proc entries from %s", count, file_path)
+
+
+_log_parse_cache = collections.OrderedDict()   # (path, mtime, size) -> entries
+_LOG_PARSE_CACHE_SIZE = 8
+
+
+def _log_source_key(file_path):
+    """Return (path, mtime, size) identifying a log file's contents, or None."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (file_path, st.st_mtime, st.st_size)
+
+
+def _cached_parse_log(file_path, cache_key=None):
+    """Return parse_log_file() results as a list, reusing an earlier parse.
+
+    Keyed on (path, mtime, size) so an edited log is re-read; keeps only the
+    most recently used few logs. Callers must not mutate the returned list.
+    A read error propagates from parse_log_file() and nothing is cached.
+    """
+    if cache_key is None:
+        cache_key = _log_source_key(file_path)
+        if cache_key is None:
+            return list(parse_log_file(file_path))
+    entries = _log_parse_cache.pop(cache_key, None)
+    if entries is None:
+        entries = list(parse_log_file(file_path))
+        if len(_log_parse_cache) >= _LOG_PARSE_CACHE_SIZE:
+            _log_parse_cache.popitem(last=False)
+    else:
+        logger.debug("Reusing parsed entries for %s", file_path)
+    _log_parse_cache[cache_key] = entries
+    return entries
+
+
+@contextlib.contextmanager
+def _detached_model(treeview, model, keep_scroll=True):
+    """Detach model from treeview (if any) for a bulk update, then reattach.
+
+    The view then lays out once instead of per changed row. set_model()
+    resets the scroll position; with keep_scroll the old offset is put back
+    from an idle callback that runs after GTK's resize pass (HIGH_IDLE + 10)
+    and before the redraw (HIGH_IDLE + 20), so it is not clamped to the
+    range of the still-empty view.
+    """
+    if treeview is None:
+        yield
+        return
+    adjustment = treeview.get_vadjustment()
+    scroll = adjustment.get_value()
+    treeview.set_model(None)
     try:
-        with open(file_path, "r") as f:
-            for i, line in enumerate(f):
-                parsed = parse_log_entry(line.strip())
-                if parsed:
-                    parsed["order"] = i + 1
-                    log_entries.append(parsed)
-        logger.info("Parsed %d proc entries from %s", len(log_entries), file_path)
-    except IOError:
-        logger.error("Error reading log file %s", file_path)
-    return log_entries
-
-
-def update_macro_view(liststore, macro):
-    """Refresh macro table (order, function, parameter string)."""
-    liststore.clear()
-    for i, entry in enumerate(macro):
-        liststore.append([i + 1, entry["function"], entry["param_string"]])
-
-
-def load_log_file(button, entry, liststore, macro):
+        yield
+    finally:
+        treeview.set_model(model)
+        if keep_scroll:
+            def restore_scroll():
+                adjustment.set_value(scroll)
+                return False
+            gobject.idle_add(restore_scroll, priority=gobject.PRIORITY_HIGH_IDLE + 15)
+
+
+def update_macro_view(liststore, macro, treeview=None):
+    """Refresh macro table (order, function, parameter string).
+
+    If the showing treeview is given, its model is detached for the refill
+    so the view lays out once instead of per appended row.
+    """
+    with _detached_model(treeview, liststore, keep_scroll=False):
+        liststore.clear()
+        for i, entry in enumerate(macro):
+            liststore.append([i + 1, entry.function, entry.param_string])
+
+
+def load_log_file(button, entry, state):
     """Open a file chooser, parse selected log, update macro table/model."""
     dialog = gtk.FileChooserDialog("Select Log File", None,
                                    gtk.FILE_CHOOSER_ACTION_OPEN,
@@ -230,13 +369,30 @@ def load_log_file(button, entry, liststore, macro):
     if response == gtk.RESPONSE_OK:
         file_path = dialog.get_filename()
         entry.set_text(file_path)
-        if file_path and os.path.exists(file_path):
-            macro[:] = parse_log_file(file_path)
-            update_macro_view(liststore, macro)
-            if not macro:
-                logger.warning("No valid proc entries in %s", file_path)
-                show_message_dialog(gtk.MESSAGE_WARNING,
-                                    "No valid processing tools found in the log file.")
+        source_key = _log_source_key(file_path) if file_path else None
+        if source_key is not None and source_key == state.macro_source:
+            # Same, unchanged log as the one loaded: nothing to parse or redraw
+            logger.debug("Log file %s unchanged since last load", file_path)
+        elif source_key is not None:
+            macro = state.macro
+            try:
+                entries = _cached_parse_log(file_path, source_key)
+            except IOError as e:
+                # The loaded macro and its source stay as they were, so
+                # picking this file again retries the read
+                logger.error("Error reading log file %s: %s", file_path, str(e))
+                show_message_dialog(gtk.MESSAGE_ERROR,
+                                    "Could not read log file: %s" % file_path)
+            else:
+                # A cached parse equal to the current macro keeps the table as it is
+                if entries != macro:
+                    macro[:] = entries
+                    update_macro_view(state.liststore, macro, state.treeview_macro)
+                state.macro_source = source_key
+                if not macro:
+                    logger.warning("No valid proc entries in %s", file_path)
+                    show_message_dialog(gtk.MESSAGE_WARNING,
+                                        "No valid processing tools found in the log file.")
         else:
             logger.error("Log file does not exist: %s", file_path)
             show_message_dialog(gtk.MESSAGE_ERROR,
@@ -247,12 +403,33 @@ def load_log_file(button, entry, liststore, macro):
 # --------------------------------
 # Generic GTK Dialog Helpers
 # --------------------------------
+_message_dialogs = {}   # msg_type -> parentless MessageDialog, reused
+
+
 def show_message_dialog(msg_type, message, parent=None):
-    """Simple OK dialog for info/warning/error messages."""
-    dialog = gtk.MessageDialog(parent=parent, flags=0, type=msg_type,
-                               buttons=gtk.BUTTONS_OK, message_format=message)
+    """Simple OK dialog for info/warning/error messages.
+
+    Parentless dialogs (the common case) are built once per message type,
+    then only re-texted and hidden between uses instead of destroyed.
+    """
+    if parent is not None:
+        dialog = gtk.MessageDialog(parent=parent, flags=0, type=msg_type,
+                                   buttons=gtk.BUTTONS_OK, message_format=message)
+        dialog.run()
+        dialog.destroy()
+        return
+
+    dialog = _message_dialogs.get(msg_type)
+    if dialog is None:
+        dialog = gtk.MessageDialog(parent=None, flags=0, type=msg_type,
+                                   buttons=gtk.BUTTONS_OK, message_format=message)
+        # Closing via the window manager must hide, not destroy, the cached dialog
+        dialog.connect("delete-event", lambda d, e: d.hide_on_delete())
+        _message_dialogs[msg_type] = dialog
+    else:
+        dialog.set_property("text", message)
     dialog.run()
-    dialog.destroy()
+    dialog.hide()
 
 
 def show_rename_confirmation_dialog(new_names, parent):
@@ -289,11 +466,9 @@ def apply_rename(button, channel_liststore, state):
         show_message_dialog(gtk.MESSAGE_ERROR, "Please enter a valid base name.")
         return
 
-    selected = []
-    for row in channel_liststore:
-        checked, title, is_channel, container, data_id, filename, _, _ = row
-        if checked and container and is_channel and data_id != -1:
-            selected.append((container, data_id, title, filename))
+    # Channel rows only (file rows carry data_id -1)
+    selected = [item for item in checked_channel_items(channel_liststore, state)
+                if item[1] != -1]
 
     if not selected:
         logger.error("No channels selected for renaming")
@@ -310,17 +485,29 @@ def apply_rename(button, channel_liststore, state):
         logger.info("Rename operation cancelled by user")
         return
 
+    name_map = dict(((id(c), d), n) for t, n, c, d, f in new_names)
+    renamed = {}
+
     def operation(container, data_id, title, filename):
-        new_name = next(n for t, n, c, d, f in new_names
-                        if c == container and d == data_id)
-        container.set_string_by_name(TITLE_KEY % data_id, new_name)
+        new_name = name_map[(id(container), data_id)]
+        container.set_string_by_name(_keys_for(data_id).title, new_name)
+        renamed[(id(container), data_id)] = new_name
         logger.info("Renamed data_id %d from %s to %s in %s",
                     data_id, title, new_name, filename)
 
     process_selected_channels(channel_liststore, operation,
                               "No valid channels to rename",
-                              "Renamed %d channels", state)
-    populate_data_channels(channel_liststore, state)
+                              "Renamed %d channels", state, selected=selected)
+
+    # Only titles changed: update those rows in place rather than rebuilding
+    # the whole table, then refresh the dropdown tooltips that list titles.
+    for row in state.channel_rows:
+        new_name = renamed.get(state.row_keys[row])
+        if new_name is not None:
+            channel_liststore.set_value(channel_liststore.iter_nth_child(None, row),
+                                        1, "  %s" % new_name)
+    if renamed:
+        refresh_select_tooltips(channel_liststore, state)
 
 
 # --------------------------------
@@ -445,11 +632,7 @@ def create_gui(state):
     hbox_palette = gtk.HBox(spacing=5)
     vbox_color.pack_start(hbox_palette, False, False, 0)
 
-    palette_store = gtk.ListStore(str, gtk.gdk.Pixbuf)
-    for name, pixbuf in get_gradient_names():
-        palette_store.append([name, pixbuf])
-
-    state.palette_combobox = gtk.ComboBox(palette_store)
+    state.palette_combobox = gtk.ComboBox(get_palette_store())
     state.palette_combobox.set_size_request(-1, -1)
     renderer_text = gtk.CellRendererText()
     state.palette_combobox.pack_start(renderer_text, True)
@@ -629,7 +812,7 @@ def create_gui(state):
 
     load_button = gtk.Button("Load Log File")
     load_button.connect("clicked",
-                        lambda b: load_log_file(b, log_entry, state.liststore, state.macro))
+                        lambda b: load_log_file(b, log_entry, state))
     hbox_log.pack_start(load_button, False, False, 1)
     data_process_vbox.pack_start(hbox_log, False, False, 0)
 
@@ -638,6 +821,7 @@ def create_gui(state):
     scrolled_macro.set_policy(gtk.POLICY_AUTOMATIC, gtk.POLICY_AUTOMATIC)
 
     treeview_macro = gtk.TreeView(state.liststore)
+    state.treeview_macro = treeview_macro
     renderer_text = gtk.CellRendererText()
     treeview_macro.append_column(gtk.TreeViewColumn("#", renderer_text, text=0))
     treeview_macro.append_column(gtk.TreeViewColumn("Function", renderer_text, text=1))
@@ -687,6 +871,9 @@ def create_gui(state):
     state.select_dropdown.set_size_request(-1, -1)  # no height override
     state.select_dropdown.connect("changed", select_dropdown_changed,
                                   state.channel_liststore, state)
+    # Tooltip for active item (connected once; populate only refills the model)
+    state.select_dropdown.set_has_tooltip(True)
+    state.select_dropdown.connect("query-tooltip", select_dropdown_query_tooltip)
 
     # Wrap in alignment to prevent GTK from stretching it vertically
     align_combo = gtk.Alignment(xalign=0.0, yalign=0.5, xscale=1.0, yscale=0.0)
@@ -714,6 +901,8 @@ def create_gui(state):
     scrolled_channels.set_policy(gtk.POLICY_AUTOMATIC, gtk.POLICY_AUTOMATIC)
 
     treeview_channels = gtk.TreeView(state.channel_liststore)
+    state.treeview_channels = treeview_channels
+    state.channel_liststore.connect("row-changed", on_channel_row_changed, state)
     renderer_toggle = gtk.CellRendererToggle()
     renderer_toggle.set_property("activatable", True)
     renderer_toggle.connect("toggled", toggle_channel_selection, state.channel_liststore)
@@ -723,7 +912,7 @@ def create_gui(state):
     column_toggle.pack_start(renderer_toggle, False)
     column_toggle.pack_start(renderer_text_select, False)
     column_toggle.set_cell_data_func(renderer_toggle, render_channel_column, treeview_channels)
-    column_toggle.set_cell_data_func(renderer_text_select, render_channel_column, treeview_channels)
+    renderer_text_select.set_property("visible", False)  # never shown; no data func needed
     treeview_channels.append_column(column_toggle)
 
     renderer_text = gtk.CellRendererText()
@@ -738,14 +927,30 @@ def create_gui(state):
     column_delete.set_cell_data_func(renderer_delete, render_delete_column, treeview_channels)
     treeview_channels.append_column(column_delete)
 
-    treeview_channels.add_events(gtk.gdk.POINTER_MOTION_MASK | gtk.gdk.LEAVE_NOTIFY_MASK)
+    # Hover state lives in plain attributes: the motion handler reads it on
+    # every pointer event, and get_data/set_data each cross into GObject.
+    treeview_channels.hover_rows = (None, None)  # (select row, close row)
+    treeview_channels.hover_redraw_rows = None
+    treeview_channels.hover_redraw_source = None
+    treeview_channels.hover_cell_area = None     # cell under the pointer
+    # GTK 2 has no per-frame motion compression; hint mode makes X send one
+    # motion event until the handler asks for the pointer again, so a fast
+    # sweep cannot queue up a backlog of hover updates.
+    treeview_channels.add_events(gtk.gdk.POINTER_MOTION_MASK | gtk.gdk.POINTER_MOTION_HINT_MASK |
+                                 gtk.gdk.LEAVE_NOTIFY_MASK)
     treeview_channels.connect("button-press-event",
                               lambda t, e: on_treeview_button_press(t, e, state.channel_liststore, state))
-    treeview_channels.connect("motion-notify-event",
-                              lambda t, e: on_treeview_motion(t, e, state.channel_liststore))
+    treeview_channels.connect("motion-notify-event", on_treeview_motion,
+                              column_toggle, column_delete)
     treeview_channels.connect("leave-notify-event", on_treeview_leave)
 
     scrolled_channels.add(treeview_channels)
+    # Scrolling (either way) moves cells under a still pointer; forget the
+    # cached cell.
+    for adjustment in (treeview_channels.get_vadjustment(),
+                       treeview_channels.get_hadjustment()):
+        adjustment.connect(
+            "value-changed", lambda adj: setattr(treeview_channels, "hover_cell_area", None))
     scrolled_channels.set_size_request(300, -1)
     right_vbox.pack_start(scrolled_channels, True, True, 2)
 
@@ -753,10 +958,8 @@ def create_gui(state):
     populate_data_channels(state.channel_liststore, state)
     check_current_selection(state)
 
-    state.timeout_id = gtk.timeout_add(500, check_current_selection, state)
-    state.last_containers = set(id(c) for c in gwy.gwy_app_data_browser_get_containers())
-    state.data_browser_timeout_id = gtk.timeout_add(1000, check_data_browser_changes,
-                                                    state.channel_liststore, state)
+    state.poll_interval = 500
+    state.timeout_id = gobject.timeout_add(state.poll_interval, poll_gwyddion, state)
     logger.debug("Started periodic data browser check")
 
     state.window.set_default_size(700, 600)
@@ -766,11 +969,14 @@ def create_gui(state):
 # --------------------------------
 # Remember Last Save Directory
 # --------------------------------
-LAST_SAVE_DIR = os.path.expanduser("~/Desktop")
-
-
 def save_last_dir(save_dir):
-    """Persist last chosen directory across sessions (in user's home)."""
+    """Persist last chosen directory across sessions (in user's home).
+
+    Also updates LAST_SAVE_DIR, which the file choosers read for the rest
+    of this session.
+    """
+    global LAST_SAVE_DIR
+    LAST_SAVE_DIR = save_dir
     try:
         with open(os.path.expanduser("~/.gwyddion_last_dir"), "w") as f:
             f.write(save_dir)
@@ -794,6 +1000,11 @@ def load_last_dir():
     return os.path.expanduser("~/Desktop")
 
 
+# Read from disk once per session; save_last_dir keeps it current and
+# persists it for the next session.
+LAST_SAVE_DIR = load_last_dir()
+
+
 def show_save_confirmation_dialog(save_files, parent):
     """Confirm that N files will be saved into a chosen directory.
 
@@ -818,25 +1029,32 @@ def show_save_confirmation_dialog(save_files, parent):
 
 def get_save_dir(parent, channel_liststore):
     """Prompt once for a directory to save all .gwy outputs into."""
-    global LAST_SAVE_DIR
-
     dialog = gtk.FileChooserDialog(title="Select Save Directory for All SPM Files",
                                    parent=parent,
                                    action=gtk.FILE_CHOOSER_ACTION_SELECT_FOLDER,
                                    buttons=(gtk.STOCK_CANCEL, gtk.RESPONSE_CANCEL,
                                             gtk.STOCK_OK, gtk.RESPONSE_OK))
 
-    # Try the directory of any selected SPM file first
+    # Try the directory of any loaded SPM file first. The table only keeps
+    # basenames, so the full path is read from each file's container, once
+    # per container, and each directory is checked only once
     initial_dir = None
+    seen = set()
+    tried = set()
     for row in channel_liststore:
-        if row[5]:
-            file_dir = os.path.dirname(row[5])
+        container = row[3]
+        if container is None or id(container) in seen:
+            continue
+        seen.add(id(container))
+        file_dir = os.path.dirname(_gis_value(container, FILENAME_KEY) or "")
+        if file_dir and file_dir not in tried:
+            tried.add(file_dir)
             if os.path.isdir(file_dir) and os.access(file_dir, os.W_OK):
                 initial_dir = file_dir
                 logger.info("Using SPM file directory: %s", initial_dir)
                 break
     if not initial_dir:
-        initial_dir = load_last_dir()
+        initial_dir = LAST_SAVE_DIR
         logger.info("No valid SPM file directory, using last directory: %s", initial_dir)
 
     dialog.set_current_folder(initial_dir)
@@ -847,7 +1065,6 @@ def get_save_dir(parent, channel_liststore):
         if not os.access(save_dir, os.W_OK):
             logger.warning("No write access to %s, falling back to Desktop", save_dir)
             save_dir = os.path.expanduser("~/Desktop")
-        LAST_SAVE_DIR = save_dir
         save_last_dir(save_dir)
     else:
         save_dir = None
@@ -859,42 +1076,61 @@ def get_save_dir(parent, channel_liststore):
 # --------------------------------
 # Ensure Log & Color Range Consistency
 # --------------------------------
-def ensure_processing_log(container, data_id, filename,
-                          log_file="c:\\users\\allani\\appdata\\local\\temp\\SPM_autoprocess.log"):
+# "data_id N" as written by this plugin's own log messages
+_DATA_ID_RE = re.compile(r"data_id (\d+)")
+
+
+def scan_processing_log(filename, log_file=LOG_FILE):
+    """Bucket the plugin log lines by the data_id they mention, in one pass.
+
+    Returns {data_id: [lines for this file, cropped in place, crop tool line]}
+    for ensure_processing_log, so a file's channels share a single read.
+    """
+    in_file = " in %s" % filename
+    by_id = {}
+    with open(log_file, "r") as f:
+        for line in f:
+            match = _DATA_ID_RE.search(line)
+            if match is None:
+                continue
+            data_id = int(match.group(1))
+            entry = by_id.get(data_id)
+            if entry is None:
+                entry = by_id[data_id] = [[], False, None]
+            if line.startswith(in_file, match.end()):
+                entry[0].append(line)
+            if not entry[1] and "Cropped in place data_id" in line:
+                entry[1] = True
+            if entry[2] is None and "tool::GwyToolCrop" in line:
+                entry[2] = line.strip()
+    return by_id
+
+
+def ensure_processing_log(container, data_id, filename, log_file=LOG_FILE, log_by_id=None):
     """Populate '/%d/log' with synthetic proc lines when possible.
 
     Tries to reconstruct a minimal log from the plugin log file for the given
-    (container, data_id, file) to make saved .gwy self-descriptive.
+    (container, data_id, file) to make saved .gwy self-descriptive. Pass
+    log_by_id from scan_processing_log() when saving several channels of
+    the same file.
     """
     try:
-        with open(log_file, "r") as f:
-            lines = f.readlines()
+        if log_by_id is None:
+            log_by_id = scan_processing_log(filename, log_file)
+        matching, cropped_in_place, crop_params = log_by_id.get(data_id, ([], False, None))
 
         log_entries = []
-        search_str = "data_id %d in %s" % (data_id, filename)
-
-        for line in lines:
-            if search_str in line:
-                for op in ["Ran ", "Cropped "]:
-                    if op in line:
-                        timestamp = line.split(" ")[0]
-                        operation = line.split(" ")[-1].strip()
-                        if op == "Ran ":
-                            operation = line.split("Ran ")[1].split(" on ")[0].strip()
-                            log_entries.append("proc::%s@%s" % (operation, timestamp))
-                        elif op == "Cropped ":
-                            crop_line = next((l for l in lines
-                                              if "Cropped in place data_id %d" % data_id in l), None)
-                            if crop_line:
-                                crop_params = next((l for l in lines
-                                                    if "tool::GwyToolCrop" in l and
-                                                       "data_id %d" % data_id in l), None)
-                                if crop_params:
-                                    log_entries.append(crop_params.strip())
+        for line in matching:
+            if "Ran " in line:
+                timestamp = line.split(" ")[0]
+                operation = line.split("Ran ")[1].split(" on ")[0].strip()
+                log_entries.append("proc::%s@%s" % (operation, timestamp))
+            if "Cropped " in line and cropped_in_place and crop_params:
+                log_entries.append(crop_params)
 
         log_value = "\n".join(log_entries) if log_entries else None
         if log_value:
-            container.set_string_by_name("/%d/log" % data_id, log_value)
+            container.set_string_by_name(_keys_for(data_id).log, log_value)
             logger.info("Set processing log for data_id %d in %s", data_id, filename)
         else:
             logger.warning("No processing log constructed for data_id %d in %s",
@@ -904,17 +1140,23 @@ def ensure_processing_log(container, data_id, filename,
                        data_id, filename, str(e))
 
 
-def ensure_color_range(container, data_id, filename):
-    """If no color range metadata exists, set defaults from actual data min/max."""
+def ensure_color_range(container, data_id, filename, data_field=None):
+    """If no color range metadata exists, set defaults from actual data min/max.
+
+    Pass data_field when the caller already fetched it; otherwise it is only
+    looked up when the range is actually missing.
+    """
     try:
-        data_field = container.get_object_by_name("/%d/data" % data_id)
-        if not container.contains_by_name("/%d/base/range" % data_id):
-            min_val, max_val = gwy.gwy_data_field_get_min_max(data_field)
-            container.set_value_by_name("/%d/base/range" % data_id, (min_val, max_val))
+        keys = _keys_for(data_id)
+        if not container.contains_by_name(keys.base_range):
+            if data_field is None:
+                data_field = container.get_object_by_name(keys.data)
+            min_val, max_val = data_field.get_min_max()
+            container.set_value_by_name(keys.base_range, (min_val, max_val))
             logger.info("Set fallback color range for data_id %d in %s: min=%f, max=%f",
                         data_id, filename, min_val, max_val)
-        if not container.contains_by_name("/%d/base/range-type" % data_id):
-            container.set_int32_by_name("/%d/base/range-type" % data_id, 1)  # GWY_LAYER_RANGE_FIXED
+        if not container.contains_by_name(keys.range_type):
+            container.set_int32_by_name(keys.range_type, 1)  # GWY_LAYER_RANGE_FIXED
             logger.info("Set fixed color range type for data_id %d in %s", data_id, filename)
     except Exception as e:
         logger.warning("Failed to set color range for data_id %d in %s: %s",
@@ -923,11 +1165,10 @@ def ensure_color_range(container, data_id, filename):
 
 def save_selected_as_single_gwy(button, channel_liststore, state):
     """Merge any selected channels → ONE perfect .gwy (full metadata, logs, calibration)"""
-    selected = []
-    for row in channel_liststore:
-        checked, title, is_channel, container, data_id, filename, _, _ = row
-        if checked and container and is_channel and data_id != -1:
-            selected.append((container, data_id, title, os.path.basename(filename or "Unknown")))
+    selected = [(container, data_id, title, os.path.basename(filename or "Unknown"))
+                for container, data_id, title, filename
+                in checked_channel_items(channel_liststore, state)
+                if data_id != -1]
 
     if not selected:
         show_message_dialog(gtk.MESSAGE_ERROR, "No channels selected.")
@@ -939,7 +1180,7 @@ def save_selected_as_single_gwy(button, channel_liststore, state):
                                    (gtk.STOCK_CANCEL, gtk.RESPONSE_CANCEL,
                                     gtk.STOCK_SAVE, gtk.RESPONSE_OK))
     dialog.set_do_overwrite_confirmation(True)
-    dialog.set_current_folder(load_last_dir())
+    dialog.set_current_folder(LAST_SAVE_DIR)
     dialog.set_current_name("Merged_Channels.gwy")
     if dialog.run() != gtk.RESPONSE_OK:
         dialog.destroy()
@@ -967,38 +1208,47 @@ def save_selected_as_single_gwy(button, channel_liststore, state):
                 # Build new key
                 new_key = new_prefix + key[len(old_prefix):]
 
-                # Copy based on actual type (safe for Gwyddion 2.69)
-                if container.contains_by_name(key):
-                    # Try object first (meta, data, calibration, etc.)
-                    if hasattr(container, 'get_object_by_name'):
-                        obj = container.get_object_by_name(key)
-                        if obj is not None:
-                            new_container.set_object_by_name(new_key, obj.duplicate())
-                            continue
-
-                    # Then string
-                    if container.get_string_by_name(key) is not None:
-                        new_container.set_string_by_name(new_key, container.get_string_by_name(key))
-                    # Then double
-                    elif container.get_double_by_name(key) is not None:
-                        new_container.set_double_by_name(new_key, container.get_double_by_name(key))
-                    # Then int32
-                    elif container.get_int32_by_name(key) is not None:
-                        new_container.set_int32_by_name(new_key, container.get_int32_by_name(key))
-                    # Then int64 (rare)
-                    elif hasattr(container, 'get_int64_by_name') and container.get_int64_by_name(key) is not None:
-                        new_container.set_int64_by_name(new_key, container.get_int64_by_name(key))
+                # Copy based on actual type (safe for Gwyddion 2.69). The key
+                # comes from keys_by_name(), so it exists; each getter is
+                # called once and its value reused for the copy.
+                # Try object first (meta, data, calibration, etc.)
+                if hasattr(container, 'get_object_by_name'):
+                    obj = container.get_object_by_name(key)
+                    if obj is not None:
+                        new_container.set_object_by_name(new_key, obj.duplicate())
+                        continue
+
+                # Then string
+                value = container.get_string_by_name(key)
+                if value is not None:
+                    new_container.set_string_by_name(new_key, value)
+                    continue
+                # Then double
+                value = container.get_double_by_name(key)
+                if value is not None:
+                    new_container.set_double_by_name(new_key, value)
+                    continue
+                # Then int32
+                value = container.get_int32_by_name(key)
+                if value is not None:
+                    new_container.set_int32_by_name(new_key, value)
+                    continue
+                # Then int64 (rare)
+                if hasattr(container, 'get_int64_by_name'):
+                    value = container.get_int64_by_name(key)
+                    if value is not None:
+                        new_container.set_int64_by_name(new_key, value)
 
             # Force title with origin
-            orig_title = container.get_string_by_name("/%d/data/title" % data_id) or title
-            new_container.set_string_by_name("/%d/data/title" % new_id,
+            orig_title = container.get_string_by_name(_keys_for(data_id).title) or title
+            new_container.set_string_by_name(_keys_for(new_id).title,
                                              "%s [%s]" % (orig_title, orig_filename))
 
-            logger.info("Merged channel %d → %d: %s [%s]" % (data_id, new_id, orig_title, orig_filename))
+            logger.info("Merged channel %d → %d: %s [%s]", data_id, new_id, orig_title, orig_filename)
             new_id += 1
 
         except Exception as e:
-            logger.error("Failed merging channel %d: %s" % (data_id, str(e)))
+            logger.error("Failed merging channel %d: %s", data_id, str(e))
 
     if new_id == 0:
         show_message_dialog(gtk.MESSAGE_ERROR, "No channels merged.")
@@ -1026,13 +1276,11 @@ def save_selected_as_single_gwy(button, channel_liststore, state):
 # --------------------------------
 def save_as_gwy(button, channel_liststore, state):
     """Save each SPM file's selected channels into a single .gwy file (report files saved)."""
-    DATA_KEY_L = "/%d/data"
     # Gather selected unique (filename, data_id)
     selected = []
     seen = set()
-    for row in channel_liststore:
-        checked, title, is_channel, container, data_id, filename, _, _ = row
-        if checked and container and is_channel and data_id != -1:
+    for container, data_id, title, filename in checked_channel_items(channel_liststore, state):
+        if data_id != -1:
             key = (filename, data_id)
             if key not in seen:
                 logger.info("Processing channel: title=%s, data_id=%d, filename=%s",
@@ -1061,16 +1309,33 @@ def save_as_gwy(button, channel_liststore, state):
         logger.info("Save as .gwy operation cancelled by user in file chooser")
         return
 
-    # Prepare output names (avoid overwrite by suffixing _processed_N)
+    # Prepare output names (avoid overwrite by suffixing _processed_N). Each
+    # job carries its own path, so the save loop needs no name lookup; one
+    # directory listing replaces an exists() call per candidate name, and
+    # names picked in this batch are added so later groups avoid them too.
+    # Names are compared via normcase() so case-insensitive filesystems
+    # (Windows) still see 'Sample.gwy' as taken by 'sample.gwy'. If the
+    # directory cannot be listed, each candidate is probed with exists().
+    try:
+        taken = set(os.path.normcase(name) for name in os.listdir(save_dir))
+        probe = False
+    except OSError:
+        taken = set()
+        probe = True
     save_files = []
+    save_jobs = []
     for filename, channels in groups.items():
         base = os.path.splitext(os.path.basename(filename))[0]
-        out_path = os.path.join(save_dir, "%s.gwy" % base)
+        out_name = "%s.gwy" % base
         counter = 1
-        while os.path.exists(out_path):
-            out_path = os.path.join(save_dir, "%s_processed_%d.gwy" % (base, counter))
+        while (os.path.normcase(out_name) in taken or
+               (probe and os.path.exists(os.path.join(save_dir, out_name)))):
+            out_name = "%s_processed_%d.gwy" % (base, counter)
             counter += 1
+        taken.add(os.path.normcase(out_name))
+        out_path = os.path.join(save_dir, out_name)
         save_files.append((base, [t for _, _, t in channels], out_path))
+        save_jobs.append((filename, channels, out_path))
 
     # Confirm and write
     if not show_save_confirmation_dialog(save_files, state.window):
@@ -1083,16 +1348,24 @@ def save_as_gwy(button, channel_liststore, state):
         container = channels[0][0]  # All channels are from same container
         success = True
 
+        # Read the plugin log once for all channels of this file
+        try:
+            log_by_id = scan_processing_log(filename)
+        except (IOError, OSError) as e:
+            logger.warning("Failed to read %s: %s", LOG_FILE, str(e))
+            log_by_id = {}
+
         # Ensure logs/ranges exist for each channel prior to save
         for _, data_id, title in channels:
             try:
-                if not container.contains_by_name(DATA_KEY_L % data_id):
+                data_field = _gis_value(container, _keys_for(data_id).data)
+                if data_field is None:
                     logger.error("No data field for data_id %d (%s) in %s",
                                  data_id, title, filename)
                     success = False
                     continue
-                ensure_processing_log(container, data_id, filename)
-                ensure_color_range(container, data_id, filename)
+                ensure_processing_log(container, data_id, filename, log_by_id=log_by_id)
+                ensure_color_range(container, data_id, filename, data_field)
                 logger.info("Prepared data_id %d (%s) for %s", data_id, title, save_path)
             except Exception as e:
                 logger.error("Failed to prepare data_id %d (%s) for %s: %s",
@@ -1125,9 +1398,7 @@ def save_as_gwy(button, channel_liststore, state):
 
     # Execute per file group and count files saved (not channels)
     files_saved = 0
-    for filename, channels in groups.items():
-        out = next(path for fname, _, path in save_files
-                   if fname == os.path.splitext(os.path.basename(filename))[0])
+    for filename, channels, out in save_jobs:
         if _save_group(filename, channels, out):
             files_saved += 1
 
@@ -1145,11 +1416,27 @@ def save_as_gwy(button, channel_liststore, state):
 # --------------------------------
 # Window Close / Cleanup
 # --------------------------------
+def disconnect_selection_signals(state):
+    """Disconnect every tracked selection "changed" handler and forget them.
+
+    The selection objects are kept alongside their handler ids, so no
+    container lookup is needed here.
+    """
+    for (container, data_id), (selection, conn_id) in state.selection_connections.items():
+        try:
+            selection.disconnect(conn_id)
+        except Exception:
+            logger.debug("Error disconnecting selection signal for data_id %d", data_id)
+    if state.selection_connections:
+        logger.debug("Disconnected %d selection signals", len(state.selection_connections))
+    state.selection_connections = {}
+
+
 def on_window_delete_event(widget, event, state):
     """Cleanup timers, signals, and release the global singleton when closing."""
     global _plugin_gui_instance
 
-    # Stop periodic timers
+    # Stop the periodic timer
     if getattr(state, 'timeout_id', None) is not None:
         try:
             gobject.source_remove(state.timeout_id)
@@ -1157,28 +1444,13 @@ def on_window_delete_event(widget, event, state):
             pass
         state.timeout_id = None
 
-    if getattr(state, 'data_browser_timeout_id', None) is not None:
-        try:
-            gobject.source_remove(state.data_browser_timeout_id)
-        except Exception:
-            pass
-        state.data_browser_timeout_id = None
-
-    # Disconnect selection signals
-    for conn_id, container, data_id in list(getattr(state, 'selection_connections', [])):
-        try:
-            for key in [SELECTION_KEYS[0] % data_id, SELECTION_KEYS[1] % data_id]:
-                if container and container.contains_by_name(key):
-                    selection = container.get_object_by_name(key)
-                    selection.disconnect(conn_id)
-        except Exception:
-            pass
-    state.selection_connections = []
+    disconnect_selection_signals(state)
     # Clear current references
     state.current_container = None
     state.current_data_id = None
+    state.last_selection_params = None
 
-    # Optional: logger handler tidy-up (matches your existing behavior)
+    # Destroy the window; logger handlers stay attached for the session
     try:
         if state.window is not None:
             try:
@@ -1190,14 +1462,10 @@ def on_window_delete_event(widget, event, state):
         pass
     state.window = None
 
-    # Optional: also clear your module-global, if you keep one
-    try:
-        global _plugin_gui_instance
-        _plugin_gui_instance = None
-    except Exception:
-        pass
+    # Release the singleton so the next launch builds a fresh window
+    _plugin_gui_instance = None
 
-    return True  
+    return True
 
 
 
@@ -1206,17 +1474,28 @@ def on_window_delete_event(widget, event, state):
 # --------------------------------
 def toggle_channel_selection(cell, path, channel_liststore):
     """Toggle the checkbox for a channel row (not file header rows)."""
-    if channel_liststore[path][2]:
-        channel_liststore[path][0] = not channel_liststore[path][0]
-        logger.debug("Toggled %s to %s", channel_liststore[path][1], channel_liststore[path][0])
+    row_iter = channel_liststore.get_iter(path)
+    checked, title, is_channel = channel_liststore.get(row_iter, 0, 1, 2)
+    if is_channel:
+        channel_liststore.set_value(row_iter, 0, not checked)
+        logger.debug("Toggled %s to %s", title, not checked)
+
+
+def on_channel_row_changed(model, path, _iter, state):
+    """Keep state.checked_rows in step with the 'Select' column."""
+    if model.get_value(_iter, 0):
+        state.checked_rows.add(path[0])
+    else:
+        state.checked_rows.discard(path[0])
 
 
 def select_all_channels(button, channel_liststore, select=True):
     """Check/uncheck all selectable channel rows (helper; unused by UI directly)."""
-    def set_selection(model, path, _iter, _select):
-        if model.get_value(_iter, 2):
-            model.set_value(_iter, 0, _select)
-    channel_liststore.foreach(set_selection, select)
+    # Plain row iteration instead of foreach(): no Python callback per row,
+    # and rows already in the wanted state are not written (no row-changed)
+    for row in channel_liststore:
+        if row[2] and row[0] != select:
+            row[0] = select
 
 
 def delete_file(cell, path, channel_liststore, state):
@@ -1232,85 +1511,88 @@ def delete_file(cell, path, channel_liststore, state):
             logger.error("Failed to delete SPM file %s", filename)
 
 
+_pixbuf_cache = {}
+
+
 def create_pixbuf(stock_id, fallback_color):
-    """Small helper to create an icon pixbuf with a GTK stock as primary source."""
+    """Small helper to create an icon pixbuf with a GTK stock as primary source.
+
+    Pixbufs are memoized per (stock_id, fallback_color) for the session, so
+    repopulating the table or reopening the window does not rebuild them.
+    """
+    cache_key = (stock_id, fallback_color)
+    pixbuf = _pixbuf_cache.get(cache_key)
+    if pixbuf is not None:
+        return pixbuf
     try:
         image = gtk.Image()
         image.set_from_stock(stock_id, gtk.ICON_SIZE_BUTTON)
         pixbuf = image.get_pixbuf()
-        if pixbuf:
-            return pixbuf
     except Exception:
-        pass
-    pixbuf = gtk.gdk.Pixbuf(gtk.gdk.COLORSPACE_RGB, True, 8, 16, 16)
-    pixbuf.fill(fallback_color)
+        pixbuf = None
+    if not pixbuf:
+        pixbuf = gtk.gdk.Pixbuf(gtk.gdk.COLORSPACE_RGB, True, 8, 16, 16)
+        pixbuf.fill(fallback_color)
+    _pixbuf_cache[cache_key] = pixbuf
     return pixbuf
 
 
 def populate_data_channels(channel_liststore, state):
     """List all open SPM files and their channels into the right pane table.
     Also populates the per-index selection dropdown with dynamic options.
-    """
-    # Preserve current checkbox states per (container, data_id)
-    checkbox_states = {}
-    for row in channel_liststore:
-        container, data_id, filename = row[3], row[4], row[5]
-        if container and data_id != -1:
-            key = (id(container), data_id)
-            checkbox_states[key] = row[0]
-        elif container and data_id == -1 and row[1] != "──────────────────":
-            key = (id(container), -1)
-            checkbox_states[key] = row[0]
-
-    # Disconnect old selection signals
-    for conn_id, container, data_id in state.selection_connections:
-        try:
-            for key in [SELECTION_KEYS[0] % data_id, SELECTION_KEYS[1] % data_id]:
-                if container.contains_by_name(key):
-                    selection = container.get_object_by_name(key)
-                    selection.disconnect(conn_id)
-                    logger.debug("Disconnected selection signal for data_id %d, key %s", data_id, key)
-        except:
-            logger.debug("Error disconnecting selection signal for data_id %d", data_id)
-    state.selection_connections = []
 
-    # Determine max number of channels across all files; gather names by index
+    When the only change since the last call is files opened after the
+    ones already listed, just their rows are appended; anything else
+    (closed or reordered files) rebuilds the table.
+    """
     containers = gwy.gwy_app_data_browser_get_containers()
-    max_channels = 0
-    channel_names_by_index = {}
-    for container in containers:
-        data_ids = gwy.gwy_app_data_browser_get_data_ids(container)
-        max_channels = max(max_channels, len(data_ids))
-        for i, data_id in enumerate(data_ids):
-            title = container.get_string_by_name(TITLE_KEY % data_id) or "Data %d" % data_id
+    container_ids = tuple(map(id, containers))
+    shown = state.last_containers
+    append = (bool(shown) and len(container_ids) > len(shown) and
+              container_ids[:len(shown)] == shown)
+
+    if append:
+        new_containers = containers[len(shown):]
+        checked_keys = set()
+    else:
+        new_containers = containers
+        # Preserve current checkbox states per (container, data_id); the mirrored
+        # row keys avoid reading every row back out of the liststore.
+        row_keys = state.row_keys
+        checked_keys = set(row_keys[row] for row in state.checked_rows) - set([None])
+
+        disconnect_selection_signals(state)
+        state.channel_names_by_index = {}
+
+    # Enumerate the (new) files' channels once; the dropdown and the table
+    # both use this list. Channel names by index accumulate across files.
+    channels = []
+    channel_names_by_index = state.channel_names_by_index
+    for container in new_containers:
+        titled = []
+        for i, data_id in enumerate(gwy.gwy_app_data_browser_get_data_ids(container)):
+            title = container.get_string_by_name(_keys_for(data_id).title) or "Data %d" % data_id
+            titled.append((data_id, title))
             if i not in channel_names_by_index:
                 channel_names_by_index[i] = set()
             channel_names_by_index[i].add(title)
+        channels.append((container, titled))
+    max_channels = len(channel_names_by_index)
 
-    # Prepare the dropdown model (with a placeholder first row)
+    # Prepare the dropdown model (with a placeholder first row); detached from
+    # the combobox while it is refilled
     if state.select_store is None:
         state.select_store = gtk.ListStore(str, bool, str)
+    state.select_dropdown.set_model(None)
     state.select_store.clear()
     state.select_store.append(["Select Options...", False, "Placeholder to guide user"])
 
     # Fill entries "First/Second/Third..." up to max_channels
+    ordinals = ("First", "Second", "Third", "Fourth",
+                "Fifth", "Sixth", "Seventh", "Eighth")
     for i in range(max_channels):
-        if i == 0:
-            option_label = "First Datachannels"
-        elif i == 1:
-            option_label = "Second Datachannels"
-        elif i == 2:
-            option_label = "Third Datachannels"
-        elif i == 3:
-            option_label = "Fourth Datachannels"
-        elif i == 4:
-            option_label = "Fifth Datachannels"
-        elif i == 5:
-            option_label = "Sixth Datachannels"
-        elif i == 6:
-            option_label = "Seventh Datachannels"
-        elif i == 7:
-            option_label = "Eighth Datachannels"
+        if i < len(ordinals):
+            option_label = "%s Datachannels" % ordinals[i]
         else:
             suffix = "th"
             if (i + 1) % 10 == 1 and (i + 1) != 11:
@@ -1328,94 +1610,144 @@ def populate_data_channels(channel_liststore, state):
     state.select_dropdown.set_model(state.select_store)
     state.select_dropdown.set_active(0)
 
-    # Tooltip for active item
-    state.select_dropdown.set_has_tooltip(True)
+    # Fill the table with the model detached, so the view reflows once
+    treeview = state.treeview_channels
+    with _detached_model(treeview, channel_liststore):
+        if treeview is not None:
+            treeview.hover_cell_area = None
+        _fill_channel_rows(channel_liststore, channels, checked_keys, state,
+                           first_file=len(shown) + 1 if append else 1)
 
-    def query_tooltip(combo, x, y, keyboard_mode, tooltip):
-        if combo.get_active_iter():
-            tooltip_text = combo.get_model()[combo.get_active()][2]
-            tooltip.set_text(tooltip_text)
-            return True
-        return False
+    # Record what the table now shows so the browser poll does not rebuild it
+    # again for a change the plugin itself just made (e.g. closing a file).
+    # A tuple in browser order: cheap to build and compare, and a reorder
+    # (which renumbers the File rows) also counts as a change.
+    state.last_containers = container_ids
+
+    logger.info("%s %d data channels from %d SPM files, max channels: %d",
+                "Appended" if append else "Populated",
+                sum(len(titled) for container, titled in channels),
+                len(new_containers), max_channels)
 
-    state.select_dropdown.connect("query-tooltip", query_tooltip)
 
-    # Fill the table
-    channel_liststore.clear()
+def refresh_select_tooltips(channel_liststore, state):
+    """Rebuild the dropdown tooltips ("Select channels: ...") from the table.
+
+    Used after in-place title edits; the rows to read come from the
+    per-index map built by _fill_channel_rows.
+    """
+    for i, rows in state.channel_rows_by_index.items():
+        if i + 1 >= len(state.select_store):
+            continue
+        names = set(channel_liststore.get_value(channel_liststore.iter_nth_child(None, row), 1)[2:]
+                    for row in rows)
+        state.channel_names_by_index[i] = names
+        state.select_store[i + 1][2] = "Select channels: %s" % ", ".join(sorted(names))
+
+
+def _fill_channel_rows(channel_liststore, channels, checked_keys, state, first_file=1):
+    """Fill the file/channel table; connect selection signals.
+
+    channels is a list of (container, [(data_id, title), ...]) per file;
+    rows whose (id(container), data_id) key is in checked_keys start ticked.
+    With first_file 1 the table is cleared first; a later number appends
+    after the rows already present, numbering the files from there.
+    """
+    if first_file == 1:
+        channel_liststore.clear()
+        state.checked_rows = set()
+        state.channel_rows = []
+        state.channel_rows_by_index = {}
+        state.row_keys = []
+    row_keys = state.row_keys
     delete_pixbuf = create_pixbuf(gtk.STOCK_CLOSE, 0xff0000ff)
     remove_pixbuf = create_pixbuf(gtk.STOCK_REMOVE, 0xffa500ff)
 
-    for idx, container in enumerate(containers, 1):
-        filename = container.get_string_by_name(FILENAME_KEY) or "Container %d" % id(container)
+    for idx, (container, titled) in enumerate(channels, first_file):
+        cid = id(container)
+        filename = container.get_string_by_name(FILENAME_KEY) or "Container %d" % cid
         filename = os.path.basename(filename) if filename else "Unknown SPM File"
 
-        file_key = (id(container), -1)
-        file_checked = checkbox_states.get(file_key, False)
-
+        # row_keys mirrors the store one entry per row, so its length is the
+        # index of the row about to be appended (no get_path() round trip)
+        file_key = (cid, -1)
+        file_checked = file_key in checked_keys
+        if file_checked:
+            state.checked_rows.add(len(row_keys))
         channel_liststore.append([file_checked, "<b>File%d: %s</b>" % (idx, filename),
-                                  False, container, -1, filename, delete_pixbuf, remove_pixbuf])
-
-        for data_id in gwy.gwy_app_data_browser_get_data_ids(container):
-            title = container.get_string_by_name(TITLE_KEY % data_id) or "Data %d" % data_id
-            channel_key = (id(container), data_id)
-            channel_checked = checkbox_states.get(channel_key, False)
+                                  False, container, -1, filename,
+                                  delete_pixbuf, remove_pixbuf])
+        row_keys.append(file_key)
+
+        for channel_index, (data_id, title) in enumerate(titled):
+            channel_key = (cid, data_id)
+            channel_checked = channel_key in checked_keys
+            row = len(row_keys)
             channel_liststore.append([channel_checked, "  %s" % title, True,
                                       container, data_id, filename, None, None])
-
-            for selection_key in [SELECTION_KEYS[0] % data_id, SELECTION_KEYS[1] % data_id]:
-                if container.contains_by_name(selection_key):
-                    selection = container.get_object_by_name(selection_key)
+            row_keys.append(channel_key)
+            state.channel_rows.append(row)
+            state.channel_rows_by_index.setdefault(channel_index, []).append(row)
+            if channel_checked:
+                state.checked_rows.add(row)
+
+            # Connect to the first selection type present only
+            for selection_key in _keys_for(data_id).selections:
+                selection = _gis_value(container, selection_key)
+                if selection is not None:
                     try:
                         conn_id = selection.connect("changed", selection_changed,
                                                     container, data_id, state)
-                        state.selection_connections.append((conn_id, container, data_id))
+                        state.selection_connections[(container, data_id)] = (selection, conn_id)
                         logger.debug("Connected selection signal for data_id %d", data_id)
                     except Exception as e:
                         logger.error("Failed to connect selection signal for data_id %d: %s",
                                      data_id, str(e))
+                    break
 
-        channel_liststore.append([False, "──────────────────", False, None, -1, "", None, None])
-
-    logger.info("Populated %d data channels from %d SPM files, max channels: %d",
-                sum(len(gwy.gwy_app_data_browser_get_data_ids(c)) for c in containers),
-                len(containers), max_channels)
+        channel_liststore.append(SEPARATOR_ROW)
+        row_keys.append(None)
 
 
 # --------------------------------
 # Selection Helpers
 # --------------------------------
+def _normalize_rect(coords, dx, dy):
+    """Convert real (x1, y1, x2, y2) corners to a pixel (x, y, width, height).
+
+    Corners may come in any order; the result always has a non-negative size.
+    """
+    x1, x2 = int(coords[0] / dx), int(coords[2] / dx)
+    y1, y2 = int(coords[1] / dy), int(coords[3] / dy)
+    if x2 < x1:
+        x1, x2 = x2, x1
+    if y2 < y1:
+        y1, y2 = y2, y1
+    return x1, y1, x2 - x1, y2 - y1
+
+
 def get_selection_params(container, data_id):
     """Return integer crop rectangle (x, y, w, h) from current rectangle selection.
 
     Coordinates are converted from real units to pixel indices.
     """
     try:
-        data_field = container.get_object_by_name(DATA_KEY % data_id)
+        keys = _keys_for(data_id)
+        data_field = container.get_object_by_name(keys.data)
         if not data_field:
             logger.error("No data field for data_id %d", data_id)
             return None, None, None, None
 
         dx, dy = data_field.get_dx(), data_field.get_dy()
-        selection_key = SELECTION_KEYS[0] % data_id
+        selection_key = keys.selections[0]
 
-        if container.contains_by_name(selection_key):
-            selection = container.get_object_by_name(selection_key)
+        selection = _gis_value(container, selection_key)
+        if selection is not None:
             try:
                 coords = selection.get_data()[:4] if hasattr(selection, 'get_data') else None
                 if coords and len(coords) == 4:
                     logger.debug("Raw selection coords for data_id %d: %s", data_id, coords)
-                    x1 = int(coords[0] / dx)
-                    y1 = int(coords[1] / dy)
-                    x2 = int(coords[2] / dx)
-                    y2 = int(coords[3] / dy)
-
-                    width = x2 - x1
-                    height = y2 - y1
-                    x = x1 if width >= 0 else x2
-                    y = y1 if height >= 0 else y2
-                    width = abs(width)
-                    height = abs(height)
-
+                    x, y, width, height = _normalize_rect(coords, dx, dy)
                     logger.debug("Normalized selection for data_id %d: x=%d, y=%d, width=%d, height=%d",
                                  data_id, x, y, width, height)
                     return x, y, width, height
@@ -1429,36 +1761,46 @@ def get_selection_params(container, data_id):
         return None, None, None, None
 
 
+def set_crop_entries(state, x, y, width, height):
+    """Show a crop rectangle in the X/Y/W/H entries (all None clears them).
+
+    Entries already showing the value are left untouched, so dragging a
+    selection only emits 'changed' for the fields that actually moved.
+    """
+    values = (x, y, width, height)
+    entries = (state.x_entry, state.y_entry, state.width_entry, state.height_entry)
+    for entry, value in zip(entries, values):
+        text = "" if value is None else str(value)
+        if entry.get_text() != text:
+            entry.set_text(text)
+
+
 def selection_changed(selection, index, container, data_id, state, *args):
     """GTK signal: update crop fields when selection rectangle changes."""
     try:
         if state.window is None:
             logger.debug("Skipping selection update for data_id %d: GUI is closed", data_id)
             return
-        x, y, width, height = get_selection_params(container, data_id)
+        # Sub-pixel drags round to the same rectangle; nothing to update then
+        params = get_selection_params(container, data_id)
+        if params == state.last_selection_params:
+            return
+        state.last_selection_params = params
+        reset_poll_backoff(state)
+        x, y, width, height = params
         if x is not None:
-            state.x_entry.set_text(str(x))
-            state.y_entry.set_text(str(y))
-            state.width_entry.set_text(str(width))
-            state.height_entry.set_text(str(height))
+            set_crop_entries(state, x, y, width, height)
             logger.debug("Dynamic selection update for data_id %d: x=%d, y=%d, width=%d, height=%d",
                          data_id, x, y, width, height)
         else:
-            state.x_entry.set_text("")
-            state.y_entry.set_text("")
-            state.width_entry.set_text("")
-            state.height_entry.set_text("")
+            set_crop_entries(state, None, None, None, None)
             logger.debug("Cleared selection fields for data_id %d due to no valid selection",
                          data_id)
     except Exception as e:
         logger.error("Error in selection_changed for data_id %d: %s", data_id, str(e))
         if state.window is not None:
-            state.x_entry.set_text("")
-            state.y_entry.set_text("")
-            state.width_entry.set_text("")
-            state.height_entry.set_text("")
+            set_crop_entries(state, None, None, None, None)
 
-##
 
 def check_current_selection(state):
     if not gwy.gwy_app_data_browser_get_containers():
@@ -1473,18 +1815,21 @@ def check_current_selection(state):
     if not data_view:
         return True
 
-    container_changed = (current_container != state.current_container)
-    view_changed = container_changed or (data_view != state.current_data_view)
+    # PyGObject hands back the same wrapper for the same GObject, so an
+    # identity test is enough and avoids the rich-compare dispatch per tick.
+    container_changed = (current_container is not state.current_container)
+    view_changed = container_changed or (data_view is not state.current_data_view)
     channel_changed = (current_data_id != state.current_data_id)
 
+    selection_key = _keys_for(current_data_id).selections[0]
+
+    # Coordinate updates arrive through the selection's "changed" signal
+    # (selection_changed); only a selection object replaced behind our back
+    # still needs the reattach below.
     if not view_changed and not channel_changed:
-        x, y, w, h = get_selection_params(current_container, current_data_id)
-        if x is not None and w > 0 and h > 0:
-            state.x_entry.set_text(str(x))
-            state.y_entry.set_text(str(y))
-            state.width_entry.set_text(str(w))
-            state.height_entry.set_text(str(h))
-        return True
+        connected = state.selection_connections.get((current_container, current_data_id))
+        if connected is not None and connected[0] is _gis_value(current_container, selection_key):
+            return True
 
     logger.debug("Crop layer reattach triggered: container_changed=%s, view_changed=%s, channel_changed=%s",
                  container_changed, view_changed, channel_changed)
@@ -1493,24 +1838,22 @@ def check_current_selection(state):
     state.current_data_id   = current_data_id
     state.current_data_view = data_view
 
-    selection_key = "/%d/select/rectangle" % current_data_id
-
     # Ensure selection object exists
-    if not current_container.contains_by_name(selection_key):
+    selection = _gis_value(current_container, selection_key)
+    created = selection is None
+    if created:
         selection = gobject.new(gobject.type_from_name('GwySelectionRectangle'))
         selection.set_max_objects(1)
         current_container.set_object_by_name(selection_key, selection)
 
-    selection = current_container.get_object_by_name(selection_key)
-
-    # Disconnect any old signal handlers for this data_id
-    for conn_id, cont, did in state.selection_connections[:]:
-        if cont == current_container and did == current_data_id:
-            try:
-                selection.disconnect(conn_id)
-            except:
-                pass
-            state.selection_connections.remove((conn_id, cont, did))
+    # Disconnect the old signal handler for this data_id, if any
+    old = state.selection_connections.pop((current_container, current_data_id), None)
+    if old is not None:
+        old_selection, old_conn_id = old
+        try:
+            old_selection.disconnect(old_conn_id)
+        except:
+            pass
 
     # Reattach the crop layer (this is what makes the blue rectangle appear)
     layer = gobject.new(gobject.type_from_name('GwyLayerRectangle'))
@@ -1518,28 +1861,26 @@ def check_current_selection(state):
     layer.set_property("is-crop", True)
     data_view.set_top_layer(layer)
 
-    # Clean conflicting selections
-    for key in ["/%d/select/pointer" % current_data_id,
-                "/%d/select/line" % current_data_id]:
-        if current_container.contains_by_name(key):
-            current_container.remove_by_name(key)
+    # Clean conflicting selections (removing an absent key is a no-op)
+    for conflict_key in _keys_for(current_data_id).conflict_selections:
+        current_container.remove_by_name(conflict_key)
 
     # Connect fresh "changed" signal
     conn_id = selection.connect("changed", selection_changed,
                                 current_container, current_data_id, state)
-    state.selection_connections.append((conn_id, current_container, current_data_id))
+    state.selection_connections[(current_container, current_data_id)] = (selection, conn_id)
 
-    x, y, w, h = get_selection_params(current_container, current_data_id)
+    # A selection created just above is empty; no need to read it back
+    if created:
+        params = (None, None, None, None)
+    else:
+        params = get_selection_params(current_container, current_data_id)
+    state.last_selection_params = params
+    x, y, w, h = params
     if x is not None and w > 0 and h > 0:
-        state.x_entry.set_text(str(x))
-        state.y_entry.set_text(str(y))
-        state.width_entry.set_text(str(w))
-        state.height_entry.set_text(str(h))
+        set_crop_entries(state, x, y, w, h)
     else:
-        state.x_entry.set_text("")
-        state.y_entry.set_text("")
-        state.width_entry.set_text("")
-        state.height_entry.set_text("")
+        set_crop_entries(state, None, None, None, None)
 
     return True
 
@@ -1561,19 +1902,95 @@ def check_data_browser_changes(channel_liststore, state):
         gtk.main_quit()
         return False
 
-    current_container_ids = set(id(c) for c in current_containers)
-    if (not hasattr(state, 'last_containers') or
-        state.last_containers != current_container_ids or
-        len(current_containers) != len(state.last_containers)):
-        logger.debug("Data browser containers changed or count mismatch, updating channel list")
+    if state.last_containers != tuple(map(id, current_containers)):
+        logger.debug("Data browser containers changed, updating channel list")
         populate_data_channels(channel_liststore, state)
-        state.last_containers = current_container_ids
     return True
 
 
+def poll_gwyddion(state):
+    """Periodic task: run the data browser and selection checks on one timer.
+
+    Ticks every 500 ms while something changes; after about 5 s with no
+    change it re-arms itself at 2 s, and drops back on the next change.
+    Changes are seen by comparing state across one tick, so edits applied
+    by signal handlers between ticks call reset_poll_backoff() instead.
+    """
+    before = (state.last_containers, state.current_container,
+              state.current_data_id, state.last_selection_params)
+    if not check_data_browser_changes(state.channel_liststore, state):
+        return False  # GUI was shut down
+    check_current_selection(state)
+    after = (state.last_containers, state.current_container,
+             state.current_data_id, state.last_selection_params)
+
+    if after != before:
+        state.poll_idle_ticks = 0
+    else:
+        state.poll_idle_ticks += 1
+    interval = 2000 if state.poll_idle_ticks >= 10 else 500
+    if interval != state.poll_interval:
+        state.poll_interval = interval
+        state.timeout_id = gobject.timeout_add(interval, poll_gwyddion, state)
+        return False
+    return True
+
+
+def reset_poll_backoff(state):
+    """Count activity seen outside poll_gwyddion as a change.
+
+    Drops a backed-off timer straight back to 500 ms; cheap when it is
+    already there, so signal handlers can call it on every event.
+    """
+    state.poll_idle_ticks = 0
+    if state.poll_interval != 500 and state.timeout_id is not None:
+        gobject.source_remove(state.timeout_id)
+        state.poll_interval = 500
+        state.timeout_id = gobject.timeout_add(500, poll_gwyddion, state)
+
+
 # --------------------------------
 # Processing Helpers
 # --------------------------------
+def _gis_value(container, key, default=None):
+    """Return the value (double, object, ...) stored under key, or default
+    when absent.
+
+    Uses the container's mapping interface, which raises KeyError for a
+    missing key, so a present value costs one lookup instead of a
+    contains_by_name() + get_*_by_name() pair.
+    """
+    try:
+        return container[key]
+    except KeyError:
+        return default
+
+
+def _set_range_type(container, keys, range_type):
+    """Set the channel's range type last, and only if it differs.
+
+    Every container write emits "item-changed" and the data view redraws
+    on each, so an unchanged range type is not written again.
+    """
+    if _gis_value(container, keys.range_type) != range_type:
+        container.set_int32_by_name(keys.range_type, range_type)
+
+
+def set_fixed_range(container, keys, start, end):
+    """Switch a channel to a fixed color range [start, end] (ChannelKeys bound)."""
+    container.set_double_by_name(keys.base_min, start)
+    container.set_double_by_name(keys.base_max, end)
+    _set_range_type(container, keys, gwy.LAYER_BASIC_RANGE_FIXED)
+
+
+def set_full_range(container, keys):
+    """Switch a channel to full color range and drop any explicit bounds."""
+    # remove_by_name() is a no-op for absent keys, no need to probe first
+    container.remove_by_name(keys.base_min)
+    container.remove_by_name(keys.base_max)
+    _set_range_type(container, keys, gwy.LAYER_BASIC_RANGE_FULL)
+
+
 def get_min_max(container, data_id):
     """Return min/max over the channel or over all channels of a file row."""
     try:
@@ -1581,42 +1998,79 @@ def get_min_max(container, data_id):
             data_ids = gwy.gwy_app_data_browser_get_data_ids(container)
             if not data_ids:
                 return None, None
-            global_min, global_max = float('inf'), float('-inf')
-            for did in data_ids:
-                data_field = container.get_object_by_name(DATA_KEY % did)
-                if data_field:
-                    global_min = min(global_min, data_field.get_min())
-                    global_max = max(global_max, data_field.get_max())
-            return global_min, global_max
+            # One fused C pass per field, then fold the pairs with the builtins
+            ranges = [data_field.get_min_max()
+                      for data_field in (_gis_value(container, _keys_for(did).data)
+                                         for did in data_ids)
+                      if data_field]
+            if not ranges:
+                return None, None
+            return min(r[0] for r in ranges), max(r[1] for r in ranges)
         else:
-            data_field = container.get_object_by_name(DATA_KEY % data_id)
-            return (data_field.get_min(), data_field.get_max()) if data_field else (None, None)
+            data_field = _gis_value(container, _keys_for(data_id).data)
+            return data_field.get_min_max() if data_field else (None, None)
     except Exception:
         return None, None
 
 
+CROP_OK, CROP_INVALID, CROP_OUT_OF_BOUNDS = 0, 1, 2
+
+
+def _crop_check(x, y, width, height, xres, yres):
+    """Classify a crop rectangle; returns one of the CROP_* codes."""
+    if x < 0 or y < 0 or width <= 0 or height <= 0:
+        return CROP_INVALID
+    if x + width > xres or y + height > yres:
+        return CROP_OUT_OF_BOUNDS
+    return CROP_OK
+
+
 def validate_crop_params(data_field, x, y, width, height, filename, spm_filename):
-    """Ensure crop rectangle is positive and within image bounds."""
+    """Ensure crop rectangle is positive and within image bounds.
+
+    The error message is only formatted when the check fails.
+    """
     xres, yres = data_field.get_xres(), data_field.get_yres()
-    if x < 0 or y < 0 or width <= 0 or height <= 0:
+    code = _crop_check(x, y, width, height, xres, yres)
+    if code == CROP_OK:
+        return True, None
+    if code == CROP_INVALID:
         return False, "Invalid crop parameters for %s in %s" % (filename, spm_filename)
-    if x + width > xres or y + height > yres:
-        return False, ("Crop area out of bounds for %s in %s: x=%d, y=%d, width=%d, height=%d"
-                       % (filename, spm_filename, x, y, width, yres))
-    return True, None
+    return False, ("Crop area out of bounds for %s in %s: x=%d, y=%d, width=%d, height=%d "
+                   "(image %dx%d)" % (filename, spm_filename, x, y, width, height, xres, yres))
 
 
-def process_selected_channels(channel_liststore, operation, no_selection_msg, success_msg, state):
-    """Generic batch runner for per-channel operations.
+def checked_channel_items(channel_liststore, state):
+    """Return (container, data_id, title, filename) for each checked channel
+    or file row, in table order.
 
-    Args:
-        operation(container, data_id, title, filename): function applied to each
+    Only the rows in state.checked_rows are read, not the whole table.
     """
     selected = []
-    for row in channel_liststore:
-        checked, title, is_channel, container, data_id, filename, _, _ = row
+    for index in sorted(state.checked_rows):
+        row_iter = channel_liststore.iter_nth_child(None, index)
+        if row_iter is None:
+            continue
+        checked, title, is_channel, container, data_id, filename = \
+            channel_liststore.get(row_iter, 0, 1, 2, 3, 4, 5)
         if checked and container and (is_channel or data_id == -1):
             selected.append((container, data_id, title, filename))
+    return selected
+
+
+def process_selected_channels(channel_liststore, operation, no_selection_msg, success_msg, state,
+                              select_last=False, selected=None):
+    """Generic batch runner for per-channel operations.
+
+    Args:
+        operation(container, data_id, title, filename): function applied to each
+        select_last: make only the last successfully processed channel current,
+            instead of each operation switching the data browser per channel
+        selected: list of (container, data_id, title, filename) to process
+            instead of the checked rows (e.g. channels already validated)
+    """
+    if selected is None:
+        selected = checked_channel_items(channel_liststore, state)
 
     if not selected:
         logger.error(no_selection_msg)
@@ -1624,13 +2078,18 @@ def process_selected_channels(channel_liststore, operation, no_selection_msg, su
         return
 
     success_count = 0
+    last_done = None
     for container, data_id, title, filename in selected:
         try:
             operation(container, data_id, title, filename)
             success_count += 1
+            last_done = (container, data_id)
         except Exception as e:
             logger.error("Failed to process %s, data_id %d: %s", filename, data_id, str(e))
 
+    if select_last and last_done is not None:
+        gwy.gwy_app_data_browser_select_data_field(*last_done)
+
     if success_count > 0:
         logger.info(success_msg % success_count)
         show_message_dialog(gtk.MESSAGE_INFO, success_msg % success_count)
@@ -1651,18 +2110,19 @@ def apply_palette(button, channel_liststore, state):
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
-        data_field = container.get_object_by_name(DATA_KEY % data_id)
+        keys = _keys_for(data_id)
+        data_field = container.get_object_by_name(keys.data)
         if not data_field:
             raise ValueError("No data field")
-        container.set_string_by_name("/%d/base/palette" % data_id, palette_name)
+        container.set_string_by_name(keys.palette, palette_name)
         data_field.data_changed()
-        gwy.gwy_app_data_browser_select_data_field(container, data_id)
         logger.info("Set palette %s on data_id %d (%s) in %s",
                     palette_name, data_id, title, filename)
 
     process_selected_channels(channel_liststore, operation,
                               "No channels selected for palette change",
-                              "Palette %s applied to %%d channels" % palette_name, state)
+                              "Palette %s applied to %%d channels" % palette_name, state,
+                              select_last=True)
 
 
 def apply_fixed_color_range(button, channel_liststore, state):
@@ -1678,16 +2138,15 @@ def apply_fixed_color_range(button, channel_liststore, state):
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
-        container.set_int32_by_name(RANGE_TYPE_KEY % data_id, gwy.LAYER_BASIC_RANGE_FIXED)
-        container.set_double_by_name(BASE_MIN_KEY % data_id, start_val)
-        container.set_double_by_name(BASE_MAX_KEY % data_id, end_val)
-        gwy.gwy_app_data_browser_select_data_field(container, data_id)
+        keys = _keys_for(data_id)
+        set_fixed_range(container, keys, start_val, end_val)
         logger.info("Applied fixed color range: Start=%f, End=%f on data_id=%d in %s",
                     start_val, end_val, data_id, filename)
 
     process_selected_channels(channel_liststore, operation,
                               "No channels selected for color range",
-                              "Fixed color range applied to %d channels", state)
+                              "Fixed color range applied to %d channels", state,
+                              select_last=True)
 
 
 def set_to_full_range(button, channel_liststore, state):
@@ -1695,40 +2154,37 @@ def set_to_full_range(button, channel_liststore, state):
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
-        data_field = container.get_object_by_name(DATA_KEY % data_id)
+        keys = _keys_for(data_id)
+        data_field = container.get_object_by_name(keys.data)
         if not data_field:
             raise ValueError("No data field")
-        if (container.contains_by_name(ORIGINAL_MIN_KEY % data_id) and
-            container.contains_by_name(ORIGINAL_MAX_KEY % data_id)):
-            original_min = container.get_double_by_name(ORIGINAL_MIN_KEY % data_id)
-            current_min = data_field.get_min()
-            if original_min != current_min:
-                data_field.add(original_min - current_min)
+        # One min/max pass; a restoring shift moves both by the same offset,
+        # so the post-shift range is derived rather than rescanned.
+        min_val, max_val = data_field.get_min_max()
+        original_min = _gis_value(container, keys.orig_min)
+        if original_min is not None and container.contains_by_name(keys.orig_max):
+            if original_min != min_val:
+                offset = original_min - min_val
+                data_field.add(offset)
                 data_field.data_changed()
-            container.remove_by_name(ORIGINAL_MIN_KEY % data_id)
-            container.remove_by_name(ORIGINAL_MAX_KEY % data_id)
+                min_val, max_val = original_min, max_val + offset
+            container.remove_by_name(keys.orig_min)
+            container.remove_by_name(keys.orig_max)
             logger.info("Restored original min=%g for data_id %d in %s",
                         original_min, data_id, filename)
 
-        container.set_int32_by_name(RANGE_TYPE_KEY % data_id, gwy.LAYER_BASIC_RANGE_FULL)
-        if container.contains_by_name(BASE_MIN_KEY % data_id):
-            container.remove_by_name(BASE_MIN_KEY % data_id)
-        if container.contains_by_name(BASE_MAX_KEY % data_id):
-            container.remove_by_name(BASE_MAX_KEY % data_id)
+        set_full_range(container, keys)
 
-        gwy.gwy_app_data_browser_select_data_field(container, data_id)
-        current_data_id = (gwy.gwy_app_data_browser_get_current(gwy.APP_DATA_FIELD_ID)
-                           if container == gwy.gwy_app_data_browser_get_current(gwy.APP_CONTAINER)
-                           else None)
-        if current_data_id == data_id:
-            min_val, max_val = data_field.get_min(), data_field.get_max()
-            state.min_entry.set_text("%.6g" % min_val if min_val is not None else "")
-            state.max_entry.set_text("%.6g" % max_val if max_val is not None else "")
+        # The last channel processed is made current afterwards, so the
+        # range entries end up showing it; no data-browser query needed.
+        state.min_entry.set_text("%.6g" % min_val)
+        state.max_entry.set_text("%.6g" % max_val)
         logger.info("Set full range for data_id %d in %s", data_id, filename)
 
     process_selected_channels(channel_liststore, operation,
                               "No channels selected for full range",
-                              "Full range applied to %d channels", state)
+                              "Full range applied to %d channels", state,
+                              select_last=True)
 
 
 def invert_mapping(button, channel_liststore, state):
@@ -1736,24 +2192,28 @@ def invert_mapping(button, channel_liststore, state):
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
-        data_field = container.get_object_by_name(DATA_KEY % data_id)
+        keys = _keys_for(data_id)
+        data_field = container.get_object_by_name(keys.data)
         if not data_field:
             raise ValueError("No data field")
 
-        current_min = (container.get_double_by_name(BASE_MIN_KEY % data_id)
-                       if container.contains_by_name(BASE_MIN_KEY % data_id) else data_field.get_min())
-        current_max = (container.get_double_by_name(BASE_MAX_KEY % data_id)
-                       if container.contains_by_name(BASE_MAX_KEY % data_id) else data_field.get_max())
-
-        container.set_int32_by_name(RANGE_TYPE_KEY % data_id, gwy.LAYER_BASIC_RANGE_FIXED)
-        container.set_double_by_name(BASE_MIN_KEY % data_id, current_max)
-        container.set_double_by_name(BASE_MAX_KEY % data_id, current_min)
-        gwy.gwy_app_data_browser_select_data_field(container, data_id)
+        current_min = _gis_value(container, keys.base_min)
+        current_max = _gis_value(container, keys.base_max)
+        if current_min is None or current_max is None:
+            # One fused pass covers whichever bound is missing
+            field_min, field_max = data_field.get_min_max()
+            if current_min is None:
+                current_min = field_min
+            if current_max is None:
+                current_max = field_max
+
+        set_fixed_range(container, keys, current_max, current_min)
         logger.info("Inverted color range for data_id %d in %s", data_id, filename)
 
     process_selected_channels(channel_liststore, operation,
                               "No channels selected for invert mapping",
-                              "Color range inverted for %d channels", state)
+                              "Color range inverted for %d channels", state,
+                              select_last=True)
 
 
 def set_zero_to_minimum(button, channel_liststore, state):
@@ -1761,37 +2221,37 @@ def set_zero_to_minimum(button, channel_liststore, state):
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
-        data_field = container.get_object_by_name(DATA_KEY % data_id)
+        keys = _keys_for(data_id)
+        data_field = container.get_object_by_name(keys.data)
         if not data_field:
             raise ValueError("No data field")
 
-        current_min, current_max = data_field.get_min(), data_field.get_max()
-        if not container.contains_by_name(ORIGINAL_MIN_KEY % data_id):
-            container.set_double_by_name(ORIGINAL_MIN_KEY % data_id, current_min)
-        if not container.contains_by_name(ORIGINAL_MAX_KEY % data_id):
-            container.set_double_by_name(ORIGINAL_MAX_KEY % data_id, current_max)
+        # One fused min/max pass; add() then shifts in a single pass and
+        # keeps Gwyddion's cached statistics valid without a rescan.
+        current_min, current_max = data_field.get_min_max()
+        if not container.contains_by_name(keys.orig_min):
+            container.set_double_by_name(keys.orig_min, current_min)
+        if not container.contains_by_name(keys.orig_max):
+            container.set_double_by_name(keys.orig_max, current_max)
 
-        data_field.add(-current_min)
-        data_field.data_changed()
+        # Already starting at zero (e.g. applied twice): skip the write pass
+        # over every pixel and the redraw it triggers
+        if current_min != 0.0:
+            data_field.add(-current_min)
+            data_field.data_changed()
 
-        container.set_int32_by_name(RANGE_TYPE_KEY % data_id, gwy.LAYER_BASIC_RANGE_FIXED)
-        container.set_double_by_name(BASE_MIN_KEY % data_id, 0.0)
-        container.set_double_by_name(BASE_MAX_KEY % data_id, current_max - current_min)
+        set_fixed_range(container, keys, 0.0, current_max - current_min)
 
-        gwy.gwy_app_data_browser_select_data_field(container, data_id)
-        current_data_id = (gwy.gwy_app_data_browser_get_current(gwy.APP_DATA_FIELD_ID)
-                           if container == gwy.gwy_app_data_browser_get_current(gwy.APP_CONTAINER)
-                           else None)
-        if current_data_id == data_id:
-            state.min_entry.set_text("0")
-            state.max_entry.set_text("%.6g" % (current_max - current_min))
+        state.min_entry.set_text("0")
+        state.max_entry.set_text("%.6g" % (current_max - current_min))
 
         logger.info("Set zero to minimum for data_id %d in %s, stored original min=%g, max=%g",
                     data_id, filename, current_min, current_max)
 
     process_selected_channels(channel_liststore, operation,
                               "No channels selected for set zero to minimum",
-                              "Zero to minimum applied to %d channels", state)
+                              "Zero to minimum applied to %d channels", state,
+                              select_last=True)
 
 
 def apply_crop(button, channel_liststore, state):
@@ -1810,23 +2270,25 @@ def apply_crop(button, channel_liststore, state):
         return
 
     # Build selection list across files
-    selected = []
+    selected = checked_channel_items(channel_liststore, state)
     valid_channels = []
     invalid_channels = []
-    for row in channel_liststore:
-        checked, title, is_channel, container, data_id, filename, _, _ = row
-        if checked and container and (is_channel or data_id == -1):
-            selected.append((container, data_id, title, filename))
 
     if not selected:
         logger.error("No files or channels selected for cropping")
         show_message_dialog(gtk.MESSAGE_ERROR, "No files or channels selected for cropping")
         return
 
+    # A checked file row expands to all its channels; a channel that is also
+    # checked on its own row is validated (and cropped) only once
+    seen = set()
     for container, data_id, title, filename in selected:
         data_ids = (gwy.gwy_app_data_browser_get_data_ids(container) if data_id == -1 else [data_id])
         for did in data_ids:
-            data_field = container.get_object_by_name(DATA_KEY % did)
+            if (id(container), did) in seen:
+                continue
+            seen.add((id(container), did))
+            data_field = container.get_object_by_name(_keys_for(did).data)
             if not data_field:
                 invalid_channels.append((container, did, title, filename, "No data field"))
                 continue
@@ -1847,29 +2309,37 @@ def apply_crop(button, channel_liststore, state):
         selected = valid_channels
 
     def operation(container, data_id, title, filename):
-        crop_channel(container, data_id, title, filename, x, y, width, height, create_new, keep_offsets)
+        crop_channel(container, data_id, title, filename, x, y, width, height, create_new,
+                     keep_offsets, validated=True)
 
     if selected:
         process_selected_channels(channel_liststore, operation, "No valid channels to crop",
-                                 "Cropping applied to %d items", state)
-        populate_data_channels(channel_liststore, state)
+                                  "Cropping applied to %d items", state, selected=selected)
+        # In-place crops keep the same channels; only new images add rows
+        if create_new:
+            populate_data_channels(channel_liststore, state)
     else:
         logger.error("No valid channels to crop after validation")
         show_message_dialog(gtk.MESSAGE_ERROR, "No valid channels to crop after validation")
 
 
-def crop_channel(container, data_id, title, filename, x, y, width, height, create_new, keep_offsets):
+def crop_channel(container, data_id, title, filename, x, y, width, height, create_new, keep_offsets,
+                 validated=False):
     """Perform the actual crop, either creating a new data field or in-place resize.
 
     Also appends a synthetic 'tool::GwyToolCrop(...)' line to '/%d/log'.
+    Pass validated=True when the rectangle was already checked against this
+    channel with validate_crop_params().
     """
-    data_field = container.get_object_by_name(DATA_KEY % data_id)
+    keys = _keys_for(data_id)
+    data_field = container.get_object_by_name(keys.data)
     if not data_field:
         raise ValueError("No data field for data_id %d" % data_id)
 
-    valid, error_msg = validate_crop_params(data_field, x, y, width, height, title, filename)
-    if not valid:
-        raise ValueError(error_msg)
+    if not validated:
+        valid, error_msg = validate_crop_params(data_field, x, y, width, height, title, filename)
+        if not valid:
+            raise ValueError(error_msg)
 
     log_entry = ("tool::GwyToolCrop(all=%s, hold_selection=4, keep_offsets=%s, new_channel=%s, "
                  "x=%d, y=%d, width=%d, height=%d)@%s" %
@@ -1877,7 +2347,7 @@ def crop_channel(container, data_id, title, filename, x, y, width, height, creat
                   x, y, width, height, datetime.now().isoformat()))
     logger.info(log_entry)
 
-    log_key = "/%d/log" % data_id
+    log_key = keys.log
     current_log = container.get_string_by_name(log_key) or ""
     container.set_string_by_name(log_key, current_log + log_entry + "\n")
     logger.debug("Manually added log entry to %s for data_id %d", log_key, data_id)
@@ -1888,11 +2358,8 @@ def crop_channel(container, data_id, title, filename, x, y, width, height, creat
         new_data_field = data_field.area_extract(x, y, width, height)
         new_id = gwy.gwy_app_data_browser_add_data_field(new_data_field, container, True)
 
-        old_title = container.get_string_by_name(TITLE_KEY % data_id) or "Data %d" % data_id
-        container.set_string_by_name(TITLE_KEY % new_id, old_title + " (Cropped)")
-
-        if container.contains_by_name("/%d/base" % data_id):
-            new_data_field.copy(container.get_object_by_name(DATA_KEY % data_id), True)
+        old_title = container.get_string_by_name(keys.title) or "Data %d" % data_id
+        container.set_string_by_name(_keys_for(new_id).title, old_title + " (Cropped)")
 
         dx, dy = data_field.get_dx(), data_field.get_dy()
         new_data_field.set_xreal(width * dx)
@@ -1910,14 +2377,23 @@ def crop_channel(container, data_id, title, filename, x, y, width, height, creat
             gwy.gwy_app_data_browser_select_data_field(container, new_id)
         logger.info("Cropped to new data_id %d in %s", new_id, filename)
     else:
-        # In-place crop
-        data_field.resize(x, y, x + width, y + height)
-        data_field.data_changed()
+        # In-place crop; a rectangle covering the whole field is a no-op, so
+        # skip libgwyddion's reallocate-and-copy and the redraw it triggers.
+        if (x, y, width, height) != (0, 0, data_field.get_xres(), data_field.get_yres()):
+            data_field.resize(x, y, x + width, y + height)
+            data_field.data_changed()
         if container:
             gwy.gwy_app_data_browser_select_data_field(container, data_id)
         logger.info("Cropped in place data_id %d in %s", data_id, filename)
 
 
+# Crop conflict dialog buttons -> the action name returned to apply_crop
+_CROP_CONFLICT_RESPONSES = {gtk.RESPONSE_CANCEL: "cancel",
+                            gtk.RESPONSE_OK: "proceed",
+                            gtk.RESPONSE_REJECT: "cancel_list",
+                            gtk.RESPONSE_APPLY: "proceed_list"}
+
+
 def show_crop_conflict_dialog(invalid_channels, valid_channels, channel_liststore, state,
                               x, y, width, height, create_new, keep_offsets):
     """Inform the user that some channels are invalid for cropping; offer options."""
@@ -1936,11 +2412,7 @@ def show_crop_conflict_dialog(invalid_channels, valid_channels, channel_liststor
     response = dialog.run()
     dialog.destroy()
 
-    response_map = {gtk.RESPONSE_CANCEL: "cancel",
-                    gtk.RESPONSE_OK: "proceed",
-                    gtk.RESPONSE_REJECT: "cancel_list",
-                    gtk.RESPONSE_APPLY: "proceed_list"}
-    response_str = response_map.get(response, "cancel")
+    response_str = _CROP_CONFLICT_RESPONSES.get(response, "cancel")
 
     if response_str in ["cancel_list", "proceed_list"]:
         show_conflict_list_dialog(invalid_channels, state.window)
@@ -1985,20 +2457,25 @@ def replay_selected_channels(button, channel_liststore, state):
 
     settings = gwy.gwy_app_settings_get()
 
+    # Settings keys and coerced values depend only on the macro, so build
+    # them once for the whole batch rather than once per channel
+    steps = [(entry.function,
+              [(key, "/module/%s/%s" % (entry.function, key), _coerce_param(raw_value))
+               for key, raw_value in entry.parameters.items()])
+             for entry in state.macro]
+
     def operation(container, data_id, title, filename):
         if data_id == -1:
             raise ValueError("Invalid channel")
         gwy.gwy_app_data_browser_select_data_field(container, data_id)
-        for entry in state.macro:
-            function, params = entry["function"], entry["parameters"]
-            for key, value in params.items():
-                settings_key = "/module/%s/%s" % (function, key)
+        for function, step_settings in steps:
+            for key, settings_key, value in step_settings:
                 try:
                     settings[settings_key] = value
                 except ValueError:
                     logger.error("Invalid setting %s=%s for %s", settings_key, value, function)
                     raise ValueError("Invalid setting %s=%s for %s" % (key, value, function))
-            gwy.gwy_app_undo_checkpoint(container, DATA_KEY % data_id)
+            gwy.gwy_app_undo_checkpoint(container, _keys_for(data_id).data)
             gwy.gwy_process_func_run(function, container, gwy.RUN_IMMEDIATE)
             logger.info("Ran %s on data_id %d in %s", function, data_id, filename)
 
@@ -2010,25 +2487,36 @@ def replay_selected_channels(button, channel_liststore, state):
 # --------------------------------
 # Gradients Inventory
 # --------------------------------
+# Gradients offered in the palette combobox (those missing are skipped)
+KNOWN_GRADIENTS = (
+    'Blend1', 'Blend2', 'Blue', 'Blue-Cyan', 'Blue-Violet', 'Blue-Yellow', 'Body', 'BW1', 'BW2',
+    'Caribbean', 'Clusters', 'Code-V', 'Cold', 'DFit', 'Digitalis', 'Gold', 'Gray-inverted',
+    'Green', 'Green-Cyan', 'Green-Stripes-4', 'Green-Violet', 'Green-Yellow', 'Gwyddion.net',
+    'Halcyon', 'Lines', 'Maple', 'MetroPro', 'Neon', 'NT-MDT', 'Olive', 'Painbow', 'Pink',
+    'Plum', 'Pm3d', 'Rainbow1', 'Rainbow2', 'Red', 'Red-Cyan', 'Red-Stripes-5', 'Red-Violet',
+    'Red-Yellow', 'RGB-Blue', 'RGB-Green', 'RGB-Red', 'Rust', 'Saw1', 'Shame', 'Sky', 'Sm2',
+    'Spectral', 'Spectral-white', 'Spring', 'Viridis', 'Warm', 'Warpp-mono', 'Warpp-spectral',
+    'Wyko', 'Yellow', 'Zones'
+)
+
+_gradient_cache = None
+
+
 def get_gradient_names():
     """Return list of available gradients with pre-rendered pixbufs if possible.
 
-    Falls back to a small subset of names when sampling is not available.
+    The rendered list is memoized for the session; gradients do not change
+    while Gwyddion runs. Falls back to a small subset of names when sampling
+    is not available (the fallback is not cached).
     """
-    known_gradients = [
-        'Blend1', 'Blend2', 'Blue', 'Blue-Cyan', 'Blue-Violet', 'Blue-Yellow', 'Body', 'BW1', 'BW2',
-        'Caribbean', 'Clusters', 'Code-V', 'Cold', 'DFit', 'Digitalis', 'Gold', 'Gray-inverted',
-        'Green', 'Green-Cyan', 'Green-Stripes-4', 'Green-Violet', 'Green-Yellow', 'Gwyddion.net',
-        'Halcyon', 'Lines', 'Maple', 'MetroPro', 'Neon', 'NT-MDT', 'Olive', 'Painbow', 'Pink',
-        'Plum', 'Pm3d', 'Rainbow1', 'Rainbow2', 'Red', 'Red-Cyan', 'Red-Stripes-5', 'Red-Violet',
-        'Red-Yellow', 'RGB-Blue', 'RGB-Green', 'RGB-Red', 'Rust', 'Saw1', 'Shame', 'Sky', 'Sm2',
-        'Spectral', 'Spectral-white', 'Spring', 'Viridis', 'Warm', 'Warpp-mono', 'Warpp-spectral',
-        'Wyko', 'Yellow', 'Zones'
-    ]
+    global _gradient_cache
+    if _gradient_cache is not None:
+        return _gradient_cache
+
     try:
         gradient_inventory = gwy.gwy_gradients()
         palettes = []
-        for name in known_gradients:
+        for name in KNOWN_GRADIENTS:
             try:
                 gradient = gwy.gwy_gradients_get_gradient(name)
                 pixbuf = gtk.gdk.Pixbuf(gtk.gdk.COLORSPACE_RGB, True, 8, 100, 20)
@@ -2039,47 +2527,57 @@ def get_gradient_names():
         if palettes:
             palettes.sort(key=lambda x: x[0])
             logger.info("Loaded %d gradient names", len(palettes))
+            _gradient_cache = palettes
             return palettes
     except Exception:
         pass
     return [('Gwyddion.net', None), ('Green', None), ('Blue', None)]
 
 
-def render_channel_column(column, cell, model, iter, treeview):
-    """Cell data func: manage 'Select' column visibility/checkbox per row type."""
-    is_selectable = model.get_value(iter, 2)
-    is_file_row = (not is_selectable and model.get_value(iter, 4) == -1 and
-                   model.get_value(iter, 1) != "──────────────────")
-    path = model.get_path(iter)
-    select_hover_path = treeview.get_data("select_hover_path")
+_palette_store = None
+
+
+def get_palette_store():
+    """Return the (name, pixbuf) model for the palette combobox.
+
+    Built once per session from get_gradient_names() and shared by every
+    window, so reopening the GUI does not refill it (the fallback list is
+    not kept, matching the gradient cache).
+    """
+    global _palette_store
+    if _palette_store is not None:
+        return _palette_store
+    palette_store = gtk.ListStore(str, gtk.gdk.Pixbuf)
+    for name, pixbuf in get_gradient_names():
+        palette_store.append([name, pixbuf])
+    if _gradient_cache is not None:
+        _palette_store = palette_store
+    return palette_store
+
 
+def render_channel_column(column, cell, model, iter, treeview):
+    """Cell data func for the 'Select' toggle: checkbox on channel rows only."""
+    checked, is_selectable = model.get(iter, 0, 2)
+    cell.set_property("visible", is_selectable)
+    cell.set_property("activatable", is_selectable)
     if is_selectable:
-        if isinstance(cell, gtk.CellRendererToggle):
-            cell.set_property("visible", True)
-            cell.set_property("active", model.get_value(iter, 0))
-            cell.set_property("activatable", True)
-        elif isinstance(cell, gtk.CellRendererText):
-            cell.set_property("visible", False)
-    else:
-        if isinstance(cell, gtk.CellRendererToggle):
-            cell.set_property("visible", False)
-            cell.set_property("activatable", False)
-        elif isinstance(cell, gtk.CellRendererText):
-            cell.set_property("visible", False)
+        cell.set_property("active", checked)
 
 
 def render_delete_column(column, cell, model, iter, treeview):
     """Cell data func: show red 'X' to close SPM files on header rows only."""
-    is_file_row = (not model.get_value(iter, 2) and model.get_value(iter, 4) == -1 and
-                   model.get_value(iter, 1) != "──────────────────")
-    path = model.get_path(iter)
-    close_hover_path = treeview.get_data("close_hover_path")
-
-    if is_file_row:
+    # Only file header rows carry the close pixbuf (column 6); channel and
+    # separator rows leave it None, so one fetch classifies the row.
+    if model.get_value(iter, 6) is not None:
+        # Hover is kept as a row index; only resolve this row's path when a
+        # close cell is actually hovered.
+        close_hover_row = treeview.hover_rows[1]
+        hovered = (close_hover_row is not None and
+                   close_hover_row == model.get_path(iter)[0])
         cell.set_property("visible", True)
         cell.set_property("text", "X")
         cell.set_property("weight", pango.WEIGHT_BOLD)
-        cell.set_property("foreground", "red" if close_hover_path == path else "black")
+        cell.set_property("foreground", "red" if hovered else "black")
     else:
         cell.set_property("visible", False)
 
@@ -2090,101 +2588,169 @@ def on_treeview_button_press(treeview, event, channel_liststore, state):
         pos = treeview.get_path_at_pos(int(event.x), int(event.y))
         if pos:
             path, column, cell_x, cell_y = pos
+            is_channel, container, data_id = channel_liststore.get(
+                channel_liststore.get_iter(path), 2, 3, 4)
             # Column 0 = Select
             if column == treeview.get_column(0):
-                if channel_liststore[path][2]:  # Channel row
+                if is_channel:  # Channel row
                     toggle_channel_selection(None, path, channel_liststore)
                     return True
                 return False
 
             # Channel title column: focus/select data
-            elif channel_liststore[path][2]:
-                container, data_id = channel_liststore[path][3], channel_liststore[path][4]
+            elif is_channel:
                 if data_id != -1:
                     gwy.gwy_app_data_browser_select_data_field(container, data_id)
-                    min_val = (container.get_double_by_name(BASE_MIN_KEY % data_id)
-                               if container.contains_by_name(BASE_MIN_KEY % data_id) else None)
-                    max_val = (container.get_double_by_name(BASE_MAX_KEY % data_id)
-                               if container.contains_by_name(BASE_MAX_KEY % data_id) else None)
+                    keys = _keys_for(data_id)
+                    min_val = _gis_value(container, keys.base_min)
+                    max_val = _gis_value(container, keys.base_max)
                     if min_val is None or max_val is None:
                         min_val, max_val = get_min_max(container, data_id)
                     state.min_entry.set_text("%.6g" % min_val if min_val is not None else "")
                     state.max_entry.set_text("%.6g" % max_val if max_val is not None else "")
                     x, y, width, height = get_selection_params(container, data_id)
                     if all(v is not None for v in (x, y, width, height)):
-                        state.x_entry.set_text(str(x))
-                        state.y_entry.set_text(str(y))
-                        state.width_entry.set_text(str(width))
-                        state.height_entry.set_text(str(height))
+                        set_crop_entries(state, x, y, width, height)
 
             # Column 2 = Close file on header rows
-            if column == treeview.get_column(2) and channel_liststore[path][4] == -1 and not channel_liststore[path][2]:
+            if column == treeview.get_column(2) and data_id == -1 and not is_channel:
                 delete_file(None, path, channel_liststore, state)
                 return True
     return False
 
 
-def on_treeview_motion(treeview, event, channel_liststore):
-    """Track hover to color the red 'X' and (optionally) select column."""
-    pos = treeview.get_path_at_pos(int(event.x), int(event.y))
-    old_select_hover_path = treeview.get_data("select_hover_path")
-    old_close_hover_path = treeview.get_data("close_hover_path")
-    new_select_hover_path = None
-    new_close_hover_path = None
+def queue_hover_redraw(treeview, rows):
+    """Schedule a debounced redraw of the given row indices (None skipped).
+
+    Each call restarts a short timer, so a fast sweep across the table only
+    redraws once the pointer settles. Only the Close column has a hover look,
+    so just its cell in each touched row is invalidated.
+    """
+    pending = treeview.hover_redraw_rows
+    if pending is None:
+        pending = set()
+    pending.update(row for row in rows if row is not None)
+    if not pending:
+        return
+
+    if treeview.hover_redraw_source is not None:
+        gobject.source_remove(treeview.hover_redraw_source)
+
+    def do_redraw():
+        treeview.hover_redraw_rows = None
+        treeview.hover_redraw_source = None
+        window = treeview.get_bin_window()
+        if window is None:  # not realized (or already destroyed)
+            return False
+        column = treeview.get_column(2)  # Close
+        for row in pending:
+            window.invalidate_rect(treeview.get_background_area((row,), column), False)
+        return False
+
+    treeview.hover_redraw_rows = pending
+    treeview.hover_redraw_source = gobject.timeout_add(15, do_redraw)
+
+
+def on_treeview_motion(treeview, event, column_toggle, column_delete):
+    """Track hover to color the red 'X' and (optionally) select column.
+
+    The Select and Close columns are bound at connect time; they never change.
+    """
+    if event.is_hint:
+        x, y = event.window.get_pointer()[:2]  # also re-arms the next hint
+    else:
+        x, y = int(event.x), int(event.y)
+    # Still inside the same cell: nothing can change, skip the hit test
+    area = treeview.hover_cell_area
+    if (area is not None and area.x <= x < area.x + area.width and
+            area.y <= y < area.y + area.height):
+        return True
+
+    pos = treeview.get_path_at_pos(x, y)
+    old_select_hover_row, old_close_hover_row = treeview.hover_rows
+    new_select_hover_row = None
+    new_close_hover_row = None
+    treeview.hover_cell_area = None
 
     if pos:
         path, column, cell_x, cell_y = pos
-        if column == treeview.get_column(0):
-            new_select_hover_path = path
-        elif column == treeview.get_column(2):
-            new_close_hover_path = path
-
-    if old_select_hover_path != new_select_hover_path or old_close_hover_path != new_close_hover_path:
-        treeview.set_data("select_hover_path", new_select_hover_path)
-        treeview.set_data("close_hover_path", new_close_hover_path)
-        treeview.queue_draw()
+        treeview.hover_cell_area = treeview.get_background_area(path, column)
+        if column is column_toggle:
+            new_select_hover_row = path[0]
+        elif column is column_delete:
+            new_close_hover_row = path[0]
+
+    if old_select_hover_row != new_select_hover_row or old_close_hover_row != new_close_hover_row:
+        treeview.hover_rows = (new_select_hover_row, new_close_hover_row)
+        # The Select cell renders the same hovered or not; only the red 'X'
+        # needs repainting
+        if old_close_hover_row != new_close_hover_row:
+            queue_hover_redraw(treeview, (old_close_hover_row, new_close_hover_row))
     return True
 
 def on_treeview_leave(treeview, event):
     """Clear hover visuals when cursor leaves the treeview area."""
-    old_select_hover_path = treeview.get_data("select_hover_path")
-    old_close_hover_path = treeview.get_data("close_hover_path")
-    if old_select_hover_path or old_close_hover_path:
-        treeview.set_data("select_hover_path", None)
-        treeview.set_data("close_hover_path", None)
-        treeview.queue_draw()
+    treeview.hover_cell_area = None
+    old_select_hover_row, old_close_hover_row = treeview.hover_rows
+    if old_select_hover_row is not None or old_close_hover_row is not None:
+        treeview.hover_rows = (None, None)
+        # Only the red 'X' has a hover look, and only a row still on screen
+        # needs repainting; otherwise clearing the state is enough.
+        if old_close_hover_row is not None:
+            visible_range = treeview.get_visible_range()
+            if (visible_range is not None and
+                    visible_range[0][0] <= old_close_hover_row <= visible_range[1][0]):
+                queue_hover_redraw(treeview, (old_close_hover_row,))
     return True
 
+def select_dropdown_query_tooltip(combo, x, y, keyboard_mode, tooltip):
+    """Show the channel names of the active dropdown option as its tooltip."""
+    if combo.get_active_iter():
+        tooltip_text = combo.get_model()[combo.get_active()][2]
+        tooltip.set_text(tooltip_text)
+        return True
+    return False
+
+
 def select_dropdown_changed(combo, channel_liststore, state):
     """Handle dropdown selection for dynamic channel indices."""
     active = combo.get_active()
     if active == 0:  # "Select Options" selected
         return
     row_index = active - 1  # Map to 0-based channel index
-    new_state = not state.select_store[active][1]
-    state.select_store[active][1] = new_state
-    current_file_container = None
-    current_row_index = -1
-    for row in channel_liststore:
-        container, data_id = row[3], row[4]
-        if data_id == -1 and row[1] != "──────────────────":
-            current_file_container = container
-            current_row_index = -1
-        elif current_file_container == container and row[2]:
-            current_row_index += 1
-            if current_row_index == row_index and row[2]:
-                row[0] = new_state
-                logger.debug("%s Channel %d for file %s", "Selected" if new_state else "Deselected", row_index + 1, row[5])
+    option_row = state.select_store[active]
+    new_state = not option_row[1]
+    option_row[1] = new_state
+    # One row per file that has this many channels, indexed at populate time
+    changed = 0
+    for row in state.channel_rows_by_index.get(row_index, ()):
+        if (row in state.checked_rows) == new_state:
+            continue
+        channel_liststore.set_value(channel_liststore.iter_nth_child(None, row), 0, new_state)
+        changed += 1
+    logger.debug("%s Channel %d in %d file(s)", "Selected" if new_state else "Deselected",
+                 row_index + 1, changed)
     combo.set_active(0)
 
 def sync_select_all_check(checkbutton, channel_liststore, state):
     """Toggle all channel checkboxes based on Select All state."""
     active = checkbutton.get_active()
-    for row in channel_liststore:
-        if row[2]:  # Only update actual channels, not file headers or separators
-            row[0] = active
-            logger.debug("%s channel %s for file %s", "Selected" if active else "Deselected", row[1], row[5])
-    logger.debug("Select All %s", "enabled" if active else "disabled")
+    # Detach the model so the view does not redraw per row
+    with _detached_model(state.treeview_channels, channel_liststore):
+        # Only actual channels (not file headers or separators), and only the
+        # rows whose box actually flips: every write emits "row-changed".
+        changed = 0
+        for row in state.channel_rows:
+            if (row in state.checked_rows) != active:
+                channel_liststore.set_value(channel_liststore.iter_nth_child(None, row), 0, active)
+                changed += 1
+    # Keep the per-index dropdown options in step, so their next pick flips
+    # the channels away from the state Select All just set
+    if state.select_store is not None:
+        for option_row in state.select_store:
+            if option_row.path[0] and option_row[1] != active:
+                option_row[1] = active
+    logger.debug("Select All %s (%d channel(s) changed)", "enabled" if active else "disabled", changed)
 
 def _find_autoprocess_window():
     """Return the existing AutoProcess window if it's already open, else None."""